@@ -6,6 +6,7 @@ import argparse
 import collections
 import io
 import logging
+import mmap
 import os
 import sys
 import zipfile
@@ -13,7 +14,7 @@ import zipfile
 from PIL import Image
 
 import numpy as np
-from pywolf.audio import samples_upsample, wave_write, convert_imf_to_wave, convert_wave_to_ogg
+from pywolf.audio import samples_upsample, wave_write, convert_imf_to_wave, convert_wave_to_ogg, SAMPLE_RATE
 import pywolf.game
 from pywolf.graphics import write_targa_bgrx, build_color_image
 import pywolf.persistence
@@ -331,7 +332,7 @@ class MapExporter(object):  # TODO
         name = cfg.ENTITY_OBJECT_MAP[entity]
         lines = []
 
-        if name in cfg.SOLID_OBJECT_NAMES:
+        if name in cfg.SOLID_OBJECT_NAMES_SET:
             face_shaders = ['common/clip'] * 6
             lines.extend(self.describe_textured_cube(tile_coords, face_shaders, self.unit_offsets))
 
@@ -682,7 +683,7 @@ class MapExporter(object):  # TODO
                     partition = find_partition(entity, cfg.ENTITY_PARTITION_MAP, count_sign=-1,
                                                cache=self.entity_partition_cache)
 
-                    if cfg.ENTITY_OBJECT_MAP.get(entity) in cfg.STATIC_OBJECT_NAMES:
+                    if cfg.ENTITY_OBJECT_MAP.get(entity) in cfg.STATIC_OBJECT_NAMES_SET:
                         lines.append('// {} @ {!r} = entity 0x{:04X}'.format(partition, tile_coords, entity))
                         lines += self.describe_sprite(tile_coords)
 
@@ -707,6 +708,10 @@ class MapExporter(object):  # TODO
         wall_start = cfg.TILE_PARTITION_MAP['wall'][0]
         wall_endex = wall_start + cfg.TILE_PARTITION_MAP['wall'][1]
         pushwall_entity = cfg.ENTITY_PARTITION_MAP['pushwall'][0]
+        solid_lut = pywolf.game.tile_lut(entity for entity, name in cfg.ENTITY_OBJECT_MAP.items()
+                                         if name in cfg.SOLID_OBJECT_NAMES_SET)
+        solid_mask = tilemap.classify(solid_lut, 1)
+        width = dimensions[0]
 
         field = {(x, y): 0 for y in range(dimensions[1]) for x in range(dimensions[0])}
         visited = {(x, y) : False for y in range(dimensions[1]) for x in range(dimensions[0])}
@@ -724,8 +729,8 @@ class MapExporter(object):  # TODO
                     facing_coords = (x + xd, y + yd)
                     facing_tile = tilemap.get(facing_coords)
                     if facing_tile is not None:
-                        object_name = cfg.ENTITY_OBJECT_MAP.get(facing_tile[1])
-                        if (not visited[facing_coords] and object_name not in cfg.SOLID_OBJECT_NAMES and
+                        solid = solid_mask[facing_coords[1] * width + facing_coords[0]]
+                        if (not visited[facing_coords] and not solid and
                             (not (wall_start <= facing_tile[0] < wall_endex) or facing_tile[1] == pushwall_entity)):
                             border_tiles.append(facing_coords)
                             field_value |= (1 << direction)
@@ -965,7 +970,7 @@ class MapExporter(object):  # TODO
                     elif partition == 'pushwall':
                         pushwall_list.append([description, tile_coords])
 
-                    elif entity_object in cfg.COLLECTABLE_OBJECT_NAMES:
+                    elif entity_object in cfg.COLLECTABLE_OBJECT_NAMES_SET:
                         lines.append(description)
                         lines += self.describe_collectable(tile_coords)
 
@@ -1036,7 +1041,7 @@ def build_argument_parser():
     group.add_argument('--wave-rate', default=22050, type=int)
     group.add_argument('--imf-rate', default=700, type=int)
     group.add_argument('--imf2wav-path', default=IMF2WAV_PATH)
-    group.add_argument('--ogg-rate', default=44100, type=int)
+    group.add_argument('--ogg-rate', default=SAMPLE_RATE, type=int)
     group.add_argument('--oggenc2-path', default=OGGENC2_PATH)
     group.add_argument('--tile-units', default=96, type=int)
     group.add_argument('--alpha-index', default=0xFF, type=int)
@@ -1078,7 +1083,7 @@ def export_textures(params, cfg, zip_file, vswap_chunks_handler):
         path = 'textures/{}_wall/{}__{}.tga'.format(params.short_name, name, (i & 1))
         logger.info('Texture [%d/%d]: %r', (i + 1), count, path)
         image = texture.image.transpose(Image.FLIP_TOP_BOTTOM).resize(scaled_size).convert('RGB')
-        pixels_bgr = bytes(x for pixel in image.getdata() for x in reversed(pixel))
+        pixels_bgr = image.tobytes('raw', 'BGR')
         texture_stream = io.BytesIO()
         write_targa_bgrx(texture_stream, scaled_size, 24, pixels_bgr)
         zip_file.writestr(path, texture_stream.getbuffer())
@@ -1090,7 +1095,7 @@ def export_textures(params, cfg, zip_file, vswap_chunks_handler):
                     (i + 1), len(palette), path, *color)
         image = build_color_image(cfg.TEXTURE_DIMENSIONS, color)
         image = image.transpose(Image.FLIP_TOP_BOTTOM).convert('RGB')
-        pixels_bgr = bytes(x for pixel in image.getdata() for x in reversed(pixel))
+        pixels_bgr = image.tobytes('raw', 'BGR')
         texture_stream = io.BytesIO()
         write_targa_bgrx(texture_stream, cfg.TEXTURE_DIMENSIONS, 24, pixels_bgr)
         zip_file.writestr(path, texture_stream.getbuffer())
@@ -1129,7 +1134,7 @@ def write_collectable_shaders(params, cfg, shader_file):
 
 
 def write_enemy_shaders(params, cfg, shader_file):
-    ignored_names = cfg.STATIC_OBJECT_NAMES + cfg.COLLECTABLE_OBJECT_NAMES
+    ignored_names = cfg.STATIC_OBJECT_NAMES_SET | cfg.COLLECTABLE_OBJECT_NAMES_SET
     names = [name for name in cfg.SPRITE_NAMES if name not in ignored_names or name.endswith('__dead')]
     for name in names:
         shader_name = 'textures/{}_enemy/{}'.format(params.short_name, name)
@@ -1263,7 +1268,7 @@ def export_pictures(params, cfg, zip_file, graphics_chunks_handler):
         path = 'gfx/{}/{}.tga'.format(params.short_name, cfg.PICTURE_NAMES[i])
         logger.info('Picture [%d/%d]: %r', (i + 1), count, path)
         top_bottom_rgb_image = picture.image.transpose(Image.FLIP_TOP_BOTTOM).convert('RGB')
-        pixels_bgr = bytes(x for pixel in top_bottom_rgb_image.getdata() for x in reversed(pixel))
+        pixels_bgr = top_bottom_rgb_image.tobytes('raw', 'BGR')
         picture_stream = io.BytesIO()
         write_targa_bgrx(picture_stream, picture.dimensions, 24, pixels_bgr)
         zip_file.writestr(path, picture_stream.getbuffer())
@@ -1285,7 +1290,7 @@ def export_tile8(params, cfg, zip_file, graphics_chunks_handler):
         path = 'gfx/{}/tile8__{}.tga'.format(params.short_name, cfg.TILE8_NAMES[i])
         logger.info('Tile8 [%d/%d]: %r', (i + 1), count, path)
         top_bottom_rgb_image = tile8.image.transpose(Image.FLIP_TOP_BOTTOM).convert('RGB')
-        pixels_bgr = bytes(x for pixel in top_bottom_rgb_image.getdata() for x in reversed(pixel))
+        pixels_bgr = top_bottom_rgb_image.tobytes('raw', 'BGR')
         tile8_stream = io.BytesIO()
         write_targa_bgrx(tile8_stream, tile8.dimensions, 24, pixels_bgr)
         zip_file.writestr(path, tile8_stream.getbuffer())
@@ -1518,11 +1523,13 @@ def main(*args):
     maps_data_path = os.path.join(params.input_folder, params.maps_data)
     maps_header_path = os.path.join(params.input_folder, params.maps_header)
     logger.info('Precaching map chunks: <data>=%r, <header>=%r', maps_data_path, maps_header_path)
-    tilemap_chunks_handler = pywolf.persistence.MapChunksHandler()
+    maps_chunks_handler = pywolf.persistence.MapChunksHandler()
     with open(maps_data_path, 'rb') as (data_file
-    ),   open(maps_header_path, 'rb') as header_file:
-        tilemap_chunks_handler.load(data_file, header_file)
-        tilemap_chunks_handler = pywolf.persistence.PrecachedChunksHandler(tilemap_chunks_handler)
+    ),   open(maps_header_path, 'rb') as (header_file
+    ),   mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ) as data_map:
+        maps_chunks_handler.load(data_map, header_file)
+        tilemap_chunks_handler = pywolf.persistence.PrecachedChunksHandler(maps_chunks_handler)
+        maps_chunks_handler.clear()  # releases its view, so that the mapping can be closed
     _sep()
 
     pk3_path = os.path.join(params.output_folder, params.output_pk3)
@@ -27,6 +27,8 @@ ADLIB_REG_FEEDBACK  = 0xC0
 ADLIB_REG_EFFECTS   = 0xBD
 ADLIB_REG_WAVE      = 0xE0
 
+SAMPLE_RATE = 44100  # output rate; source rates (e.g. SAMPLED_SOUND_FREQUENCY) come from the game config
+
 
 def samples_expand(chunks_handler, index):
     sounds_start = chunks_handler.sounds_start
@@ -136,7 +138,7 @@ class SquareWaveGenerator(object):
             yield from (silence for _ in range(length))
 
 
-def buzzer_expand(dividers, sample_rate=44100, char_rate=140, buzzer_clock=1193180, round_period=True):
+def buzzer_expand(dividers, sample_rate=SAMPLE_RATE, char_rate=140, buzzer_clock=1193180, round_period=True):
     generator = SquareWaveGenerator(sample_rate, high=0xFF, low=0x00, silence=0x80, round_period=round_period)
     char_length = sample_rate / char_rate
     offset = 0
@@ -149,7 +151,7 @@ def buzzer_expand(dividers, sample_rate=44100, char_rate=140, buzzer_clock=11931
         offset = length - length_floor
 
 
-def convert_imf_to_wave(imf_chunk, imf2wav_path, wave_path=None, wave_rate=44100, imf_rate=700, chunk_path=None):
+def convert_imf_to_wave(imf_chunk, imf2wav_path, wave_path=None, wave_rate=SAMPLE_RATE, imf_rate=700, chunk_path=None):
     wave_is_temporary = wave_path is None
     chunk_is_temporary = chunk_path is None
     tempdir_path = tempfile.gettempdir()
@@ -233,10 +235,10 @@ class BuzzerSound(object):
     def __getitem__(self, key):
         return self.dividers[key]
 
-    def to_samples(self, rate=44100):
+    def to_samples(self, rate=SAMPLE_RATE):
         yield from buzzer_expand(self.dividers, rate)
 
-    def wave_write(self, file, rate=44100):
+    def wave_write(self, file, rate=SAMPLE_RATE):
         samples = bytes(self.to_samples(rate))
         wave_write(file, rate, samples)
 
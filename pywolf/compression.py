@@ -1,4 +1,7 @@
 import array
+import functools
+import itertools
+import struct
 import sys
 
 from pywolf.utils import reverse_byte
@@ -13,6 +16,9 @@ HUFFMAN_CLONE_NODES = (tuple((HUFFMAN_REVERSED[i], HUFFMAN_REVERSED[i + 1])
                        tuple((HUFFMAN_NODE_COUNT + i, HUFFMAN_NODE_COUNT + i + 1)
                              for i in range(0, HUFFMAN_NODE_COUNT - 1, 2)))
 
+HUFFMAN_BYTE_BITS = tuple(tuple((datum >> shift) & 1 for shift in range(8))  # LSB first
+                          for datum in range(256))
+
 HUFFMAN_MAX_DEPTH = 24
 HUFFMAN_MAX_CODE = 0xFFFF
 HUFFMAN_MAX_PROBABILITY = 0x7FFFFFFF
@@ -123,45 +129,103 @@ def huffman_compress(data, shifts, masks):
     return output
 
 
-def huffman_expand(data, expanded_size, nodes):
-    assert expanded_size > 0
-
-    head = nodes[HUFFMAN_HEAD_INDEX]
-    output = bytearray()
-    append = output.append
+def huffman_build_branches(nodes):
+    # Flat state table, indexed by node index * 2 + bit: either the next state or ~symbol
+    branches = [(value - HUFFMAN_NODE_COUNT) << 1 if value >= HUFFMAN_NODE_COUNT else ~value
+                for value in itertools.chain.from_iterable(nodes)]
+    assert len(branches) == HUFFMAN_NODE_COUNT * 2
+    return branches
+
+
+@functools.lru_cache(maxsize=8)
+def _huffman_cached_branches(nodes):
+    return huffman_build_branches(nodes)
+
+
+def huffman_walk(branches, state, bits):
+    emitted = bytearray()
+    head = HUFFMAN_HEAD_INDEX << 1
+    for bit in bits:
+        state = branches[state | bit]
+        if state < 0:
+            emitted.append(~state)
+            state = head
+    return bytes(emitted), state
+
+
+def huffman_build_table(branches):
+    # Whole input bytes per step, indexed by state << 7 | byte: (emitted symbols, next state)
+    head = HUFFMAN_HEAD_INDEX << 1
+    reachable = {head}  # unused nodes may hold garbage
+    pending = [head]
+    while pending:
+        state = pending.pop()
+        for target in branches[state:(state + 2)]:
+            if target >= 0 and target not in reachable:
+                reachable.add(target)
+                pending.append(target)
+
+    nibble_walks = {}
+    for state in reachable:
+        for nibble in range(16):
+            nibble_walks[(state << 3) | nibble] = huffman_walk(branches, state, HUFFMAN_BYTE_BITS[nibble][:4])
+
+    symbols = []
+    states = []
+    for state in range(0, HUFFMAN_NODE_COUNT * 2, 2):
+        if state in reachable:
+            for datum in range(256):
+                symbols0, state0 = nibble_walks[(state << 3) | (datum & 15)]
+                symbols1, state1 = nibble_walks[(state0 << 3) | (datum >> 4)]
+                symbols.append(symbols0 + symbols1)
+                states.append(state1)
+        else:
+            symbols.extend(itertools.repeat(b'', 256))
+            states.extend(itertools.repeat(head, 256))
+    return symbols, states
 
-    it = iter(data)
-    try:
-        datum = next(it)
-        mask = 1 << 0
-        node = head
 
-        while True:
-            value = node[1 if datum & mask else 0]
-            if value < HUFFMAN_NODE_COUNT:
-                append(value)
-                node = head
-                if len(output) >= expanded_size:
-                    break
-            else:
-                node = nodes[value - HUFFMAN_NODE_COUNT]
+def huffman_expand(data, expanded_size, nodes, branches=None, table=None):
+    assert expanded_size > 0
 
-            if mask == 1 << 7:
-                datum = next(it)
-                mask = 1 << 0
-            else:
-                mask <<= 1
+    if table is not None:
+        symbols, states = table
+        state = HUFFMAN_HEAD_INDEX << 1
+        chunks = []
+        append = chunks.append
+        for datum in data:
+            index = (state << 7) | datum
+            append(symbols[index])
+            state = states[index]
+        output = b''.join(chunks)
+        if len(output) < expanded_size:  # zero padded if data ends early
+            output += bytes(expanded_size - len(output))
+        return output[:expanded_size]
+
+    if branches is None:  # small chunks: rebuilding would cost more than the walk
+        branches = _huffman_cached_branches(tuple(map(tuple, nodes)))
+    head = HUFFMAN_HEAD_INDEX << 1
+    output = bytearray(expanded_size)  # zero padded if data ends early
+    size = 0
+    state = head
 
-    except StopIteration:
-        output += bytes(expanded_size - len(output))
+    for datum in data:
+        for bit in HUFFMAN_BYTE_BITS[datum]:
+            state = branches[state | bit]
+            if state < 0:
+                output[size] = ~state
+                size += 1
+                if size >= expanded_size:
+                    return bytes(output)
+                state = head
 
-    output = bytes(output)
-    return output
+    return bytes(output)
 
 
 CARMACK_NEAR_TAG = 0xA7
 CARMACK_FAR_TAG = 0xA8
 CARMACK_MAX_SIZE = 1 << 17
+CARMACK_TAG_BYTES = (bytes((CARMACK_NEAR_TAG,)), bytes((CARMACK_FAR_TAG,)))
 
 
 def carmack_compress(data):
@@ -233,31 +297,47 @@ def carmack_expand(data, expanded_size):
     assert expanded_size > 0
     assert expanded_size % 2 == 0
 
+    data = bytes(data)
+    find = data.find
+    size = len(data)
     output = bytearray()
-    append = output.append
     extend = output.extend
 
-    it = iter(data)
+    index = 0
     ahead = expanded_size >> 1
     while ahead:
-        count, tag = next(it), next(it)
-        if tag == CARMACK_NEAR_TAG or tag == CARMACK_FAR_TAG:
-            if count:
-                if ahead < count:
-                    break
-                if tag == CARMACK_NEAR_TAG:
-                    offset = len(output) - (next(it) << 1)
-                else:
-                    offset = (next(it) | (next(it) << 8)) << 1
-                extend(output[offset:(offset + (count << 1))])
-                ahead -= count
+        # Copy plain words in bulk, up to the next word with a tag as high byte
+        limit = min(index + (ahead << 1), size)
+        tag_index = limit
+        for tag_byte in CARMACK_TAG_BYTES:
+            found = find(tag_byte, index + 1, tag_index)
+            while found >= 0 and not (found - index) & 1:
+                found = find(tag_byte, found + 1, tag_index)
+            if found >= 0:
+                tag_index = found
+
+        plain_size = (tag_index - index) & ~1
+        if plain_size:
+            extend(data[index:(index + plain_size)])
+            index += plain_size
+            ahead -= plain_size >> 1
+            continue
+
+        count, tag = data[index], data[index + 1]
+        if count:
+            if ahead < count:
+                break
+            if tag == CARMACK_NEAR_TAG:
+                offset = len(output) - (data[index + 2] << 1)
+                index += 3
             else:
-                append(next(it))
-                append(tag)
-                ahead -= 1
+                offset = (data[index + 2] | (data[index + 3] << 8)) << 1
+                index += 4
+            extend(output[offset:(offset + (count << 1))])
+            ahead -= count
         else:
-            append(count)
-            append(tag)
+            extend((data[index + 2], tag))
+            index += 3
             ahead -= 1
 
     output = bytes(output)
@@ -317,15 +397,37 @@ def rlew_compress(data, tag):
     return output
 
 
-def rlew_expand(data, tag):
-    source = array.array('H', data)
-    output = array.array('H')
+def rlew_tag_bytes(tag):
+    return struct.pack('<H', tag)
 
-    rle_expand(source, output, tag)
 
-    if sys.byteorder != 'little':
-        output.byteswap()
-    output = output.tobytes()
+def rlew_expand(data, tag, tag_bytes=None):
+    data = bytes(data)
+    find = data.find
+    size = len(data)
+    assert size % 2 == 0
+    if tag_bytes is None:  # callers expanding many chunks pass rlew_tag_bytes(tag)
+        tag_bytes = rlew_tag_bytes(tag)
+    output = bytearray()
+    extend = output.extend
+
+    index = 0
+    while index < size:
+        found = find(tag_bytes, index)
+        while found >= 0 and (found - index) & 1:
+            found = find(tag_bytes, found + 1)
+        if found < 0:
+            extend(data[index:])
+            break
+
+        extend(data[index:found])
+        if found + 6 > size:
+            break
+        count = data[found + 2] | (data[found + 3] << 8)
+        extend(data[(found + 4):(found + 6)] * count)
+        index = found + 6
+
+    output = bytes(output)
     return output
 
 
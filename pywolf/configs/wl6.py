@@ -1,12 +1,47 @@
+import itertools
+import os
+import sys
+from types import MappingProxyType
+
+
 def _rgbpalette_flatten(palette_colors):
-    flat_palette = []
-    for color in palette_colors:
-        assert len(color) == 3
-        flat_palette += color
+    assert all(len(color) == 3 for color in palette_colors)
+    flat_palette = list(itertools.chain.from_iterable(palette_colors))
     return flat_palette
 
 
-GRAPHICS_PARTITIONS_MAP = {
+def _intern_names(names):
+    return [sys.intern(name) for name in names]
+
+
+_NAMES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wl6_names')
+
+
+def _load_names(stem):
+    path = os.path.join(_NAMES_FOLDER, stem + '.txt')
+    with open(path, 'rt', encoding='ascii') as names_file:
+        names = names_file.read().split('\n')
+    return _intern_names(name for name in names if name)
+
+
+def _expand_sprite_names(entries):
+    names = []
+    for entry in entries:
+        if isinstance(entry, str):
+            names.append(entry)
+        else:
+            prefix, frames, directions = entry
+            if frames and directions:
+                names.extend('{}_a{:d}_d{:d}'.format(prefix, frame, direction)
+                             for frame, direction in itertools.product(range(frames), range(directions)))
+            elif frames:
+                names.extend('{}_a{:d}'.format(prefix, frame) for frame in range(frames))
+            else:
+                names.extend('{}_d{:d}'.format(prefix, direction) for direction in range(directions))
+    return _intern_names(names)
+
+
+GRAPHICS_PARTITIONS_MAP = MappingProxyType({
     'struct':   (  0,   1),
     'font':     (  1,   2),
     'fontm':    (  3,   0),
@@ -25,7 +60,7 @@ GRAPHICS_PARTITIONS_MAP = {
     'helpart':  (138,   1),
     'demos':    (139,   4),
     'endart':   (143,   6),
-}
+})
 
 GRAPHICS_PALETTE = [
     (0x00, 0x00, 0x00),  # 0x00
@@ -302,673 +337,27 @@ GRAPHICS_PALETTE = [
 ]
 
 
-GRAPHICS_PALETTE_MAP = {
+GRAPHICS_PALETTE_MAP = MappingProxyType({
     ...: _rgbpalette_flatten(GRAPHICS_PALETTE)
-}
+})
 
 TILE8_NAMES = [str(i) for i in range(GRAPHICS_PARTITIONS_MAP['tile8'][1])]  # TODO
 
-PICTURE_LABELS = [
-    'H_BJPIC',
-    'H_CASTLEPIC',
-    'H_BLAZEPIC',
-    'H_TOPWINDOWPIC',
-    'H_LEFTWINDOWPIC',
-    'H_RIGHTWINDOWPIC',
-    'H_BOTTOMINFOPIC',
-
-    'C_OPTIONSPIC',
-    'C_CURSOR1PIC',
-    'C_CURSOR2PIC',
-    'C_NOTSELECTEDPIC',
-    'C_SELECTEDPIC',
-    'C_FXTITLEPIC',
-    'C_DIGITITLEPIC',
-    'C_MUSICTITLEPIC',
-    'C_MOUSELBACKPIC',
-    'C_BABYMODEPIC',
-    'C_EASYPIC',
-    'C_NORMALPIC',
-    'C_HARDPIC',
-    'C_LOADSAVEDISKPIC',
-    'C_DISKLOADING1PIC',
-    'C_DISKLOADING2PIC',
-    'C_CONTROLPIC',
-    'C_CUSTOMIZEPIC',
-    'C_LOADGAMEPIC',
-    'C_SAVEGAMEPIC',
-    'C_EPISODE1PIC',
-    'C_EPISODE2PIC',
-    'C_EPISODE3PIC',
-    'C_EPISODE4PIC',
-    'C_EPISODE5PIC',
-    'C_EPISODE6PIC',
-    'C_CODEPIC',
-    'C_TIMECODEPIC',
-    'C_LEVELPIC',
-    'C_NAMEPIC',
-    'C_SCOREPIC',
-    'C_JOY1PIC',
-    'C_JOY2PIC',
-
-    'L_GUYPIC',
-    'L_COLONPIC',
-    'L_NUM0PIC',
-    'L_NUM1PIC',
-    'L_NUM2PIC',
-    'L_NUM3PIC',
-    'L_NUM4PIC',
-    'L_NUM5PIC',
-    'L_NUM6PIC',
-    'L_NUM7PIC',
-    'L_NUM8PIC',
-    'L_NUM9PIC',
-    'L_PERCENTPIC',
-    'L_APIC',
-    'L_BPIC',
-    'L_CPIC',
-    'L_DPIC',
-    'L_EPIC',
-    'L_FPIC',
-    'L_GPIC',
-    'L_HPIC',
-    'L_IPIC',
-    'L_JPIC',
-    'L_KPIC',
-    'L_LPIC',
-    'L_MPIC',
-    'L_NPIC',
-    'L_OPIC',
-    'L_PPIC',
-    'L_QPIC',
-    'L_RPIC',
-    'L_SPIC',
-    'L_TPIC',
-    'L_UPIC',
-    'L_VPIC',
-    'L_WPIC',
-    'L_XPIC',
-    'L_YPIC',
-    'L_ZPIC',
-    'L_EXPOINTPIC',
-    'L_APOSTROPHEPIC',
-    'L_GUY2PIC',
-    'L_BJWINSPIC',
-    'STATUSBARPIC',
-    'TITLEPIC',
-    'PG13PIC',
-    'CREDITSPIC',
-    'HIGHSCORESPIC',
-
-    'KNIFEPIC',
-    'GUNPIC',
-    'MACHINEGUNPIC',
-    'GATLINGGUNPIC',
-    'NOKEYPIC',
-    'GOLDKEYPIC',
-    'SILVERKEYPIC',
-    'N_BLANKPIC',
-    'N_0PIC',
-    'N_1PIC',
-    'N_2PIC',
-    'N_3PIC',
-    'N_4PIC',
-    'N_5PIC',
-    'N_6PIC',
-    'N_7PIC',
-    'N_8PIC',
-    'N_9PIC',
-    'FACE1APIC',
-    'FACE1BPIC',
-    'FACE1CPIC',
-    'FACE2APIC',
-    'FACE2BPIC',
-    'FACE2CPIC',
-    'FACE3APIC',
-    'FACE3BPIC',
-    'FACE3CPIC',
-    'FACE4APIC',
-    'FACE4BPIC',
-    'FACE4CPIC',
-    'FACE5APIC',
-    'FACE5BPIC',
-    'FACE5CPIC',
-    'FACE6APIC',
-    'FACE6BPIC',
-    'FACE6CPIC',
-    'FACE7APIC',
-    'FACE7BPIC',
-    'FACE7CPIC',
-    'FACE8APIC',
-    'GOTGATLINGPIC',
-    'MUTANTBJPIC',
-    'PAUSEDPIC',
-    'GETPSYCHEDPIC',
-]
+PICTURE_LABELS = _load_names('picture_labels')
 
 PICTURE_NAMES = PICTURE_LABELS  # TODO
 
 
 TEXTURE_DIMENSIONS = (64, 64)
 
-TEXTURE_NAMES = [  # index // 2
-    'grey_brick_1',
-    'grey_brick_2',
-    'grey_brick__flag',
-    'grey_brick__hitler',
-    'cell',
-    'grey_brick__eagle',
-    'cell__skeleton',
-    'blue_brick_1',
-    'blue_brick_2',
-    'wood__eagle',
-    'wood__hitler',
-    'wood',
-    'entrance_to_level',
-    'steel__sign',
-    'steel',
-    'landscape',
-    'red_brick',
-    'red_brick__swastika',
-    'purple',
-    'red_brick__flag',
-    'elevator',
-    'fake_elevator',
-    'wood__iron_cross',
-    'dirty_brick_1',
-    'purple__blood',
-    'dirty_brick_2',
-    'grey_brick_3',
-    'grey_brick__sign',
-    'brown_weave',
-    'brown_weave__blood_2',
-    'brown_weave__blood_3',
-    'brown_weave__blood_1',
-    'stained_glass',
-    'blue_wall__skull',
-    'grey_wall_1',
-    'blue_wall__swastika',
-    'grey_wall__vent',
-    'multicolor_brick',
-    'grey_wall_2',
-    'blue_wall',
-    'blue_brick__sign',
-    'brown_marble_1',
-    'grey_wall__map',
-    'brown_stone_1',
-    'brown_stone_2',
-    'brown_marble_2',
-    'brown_marble__flag',
-    'wood_panel',
-    'grey_wall__hitler',
-    'door_panel',
-    'door_hinge',
-    'door_elevator',
-    'door_locked',
-]
+TEXTURE_NAMES = _load_names('texture_names')  # index // 2
 
 
 SPRITE_DIMENSIONS = (64, 64)
 
-SPRITE_LABELS = [
-    'SPR_DEMO',
-    'SPR_DEATHCAM',
-    'SPR_STAT_0',
-    'SPR_STAT_1',
-    'SPR_STAT_2',
-    'SPR_STAT_3',
-    'SPR_STAT_4',
-    'SPR_STAT_5',
-    'SPR_STAT_6',
-    'SPR_STAT_7',
-    'SPR_STAT_8',
-    'SPR_STAT_9',
-    'SPR_STAT_10',
-    'SPR_STAT_11',
-    'SPR_STAT_12',
-    'SPR_STAT_13',
-    'SPR_STAT_14',
-    'SPR_STAT_15',
-    'SPR_STAT_16',
-    'SPR_STAT_17',
-    'SPR_STAT_18',
-    'SPR_STAT_19',
-    'SPR_STAT_20',
-    'SPR_STAT_21',
-    'SPR_STAT_22',
-    'SPR_STAT_23',
-    'SPR_STAT_24',
-    'SPR_STAT_25',
-    'SPR_STAT_26',
-    'SPR_STAT_27',
-    'SPR_STAT_28',
-    'SPR_STAT_29',
-    'SPR_STAT_30',
-    'SPR_STAT_31',
-    'SPR_STAT_32',
-    'SPR_STAT_33',
-    'SPR_STAT_34',
-    'SPR_STAT_35',
-    'SPR_STAT_36',
-    'SPR_STAT_37',
-    'SPR_STAT_38',
-    'SPR_STAT_39',
-    'SPR_STAT_40',
-    'SPR_STAT_41',
-    'SPR_STAT_42',
-    'SPR_STAT_43',
-    'SPR_STAT_44',
-    'SPR_STAT_45',
-    'SPR_STAT_46',
-    'SPR_STAT_47',
-
-    'SPR_GRD_S_1',
-    'SPR_GRD_S_2',
-    'SPR_GRD_S_3',
-    'SPR_GRD_S_4',
-    'SPR_GRD_S_5',
-    'SPR_GRD_S_6',
-    'SPR_GRD_S_7',
-    'SPR_GRD_S_8',
-    'SPR_GRD_W1_1',
-    'SPR_GRD_W1_2',
-    'SPR_GRD_W1_3',
-    'SPR_GRD_W1_4',
-    'SPR_GRD_W1_5',
-    'SPR_GRD_W1_6',
-    'SPR_GRD_W1_7',
-    'SPR_GRD_W1_8',
-    'SPR_GRD_W2_1',
-    'SPR_GRD_W2_2',
-    'SPR_GRD_W2_3',
-    'SPR_GRD_W2_4',
-    'SPR_GRD_W2_5',
-    'SPR_GRD_W2_6',
-    'SPR_GRD_W2_7',
-    'SPR_GRD_W2_8',
-    'SPR_GRD_W3_1',
-    'SPR_GRD_W3_2',
-    'SPR_GRD_W3_3',
-    'SPR_GRD_W3_4',
-    'SPR_GRD_W3_5',
-    'SPR_GRD_W3_6',
-    'SPR_GRD_W3_7',
-    'SPR_GRD_W3_8',
-    'SPR_GRD_W4_1',
-    'SPR_GRD_W4_2',
-    'SPR_GRD_W4_3',
-    'SPR_GRD_W4_4',
-    'SPR_GRD_W4_5',
-    'SPR_GRD_W4_6',
-    'SPR_GRD_W4_7',
-    'SPR_GRD_W4_8',
-    'SPR_GRD_PAIN_1',
-    'SPR_GRD_DIE_1',
-    'SPR_GRD_DIE_2',
-    'SPR_GRD_DIE_3',
-    'SPR_GRD_PAIN_2',
-    'SPR_GRD_DEAD',
-    'SPR_GRD_SHOOT1',
-    'SPR_GRD_SHOOT2',
-    'SPR_GRD_SHOOT3',
-
-    'SPR_DOG_W1_1',
-    'SPR_DOG_W1_2',
-    'SPR_DOG_W1_3',
-    'SPR_DOG_W1_4',
-    'SPR_DOG_W1_5',
-    'SPR_DOG_W1_6',
-    'SPR_DOG_W1_7',
-    'SPR_DOG_W1_8',
-    'SPR_DOG_W2_1',
-    'SPR_DOG_W2_2',
-    'SPR_DOG_W2_3',
-    'SPR_DOG_W2_4',
-    'SPR_DOG_W2_5',
-    'SPR_DOG_W2_6',
-    'SPR_DOG_W2_7',
-    'SPR_DOG_W2_8',
-    'SPR_DOG_W3_1',
-    'SPR_DOG_W3_2',
-    'SPR_DOG_W3_3',
-    'SPR_DOG_W3_4',
-    'SPR_DOG_W3_5',
-    'SPR_DOG_W3_6',
-    'SPR_DOG_W3_7',
-    'SPR_DOG_W3_8',
-    'SPR_DOG_W4_1',
-    'SPR_DOG_W4_2',
-    'SPR_DOG_W4_3',
-    'SPR_DOG_W4_4',
-    'SPR_DOG_W4_5',
-    'SPR_DOG_W4_6',
-    'SPR_DOG_W4_7',
-    'SPR_DOG_W4_8',
-    'SPR_DOG_DIE_1',
-    'SPR_DOG_DIE_2',
-    'SPR_DOG_DIE_3',
-    'SPR_DOG_DEAD',
-    'SPR_DOG_JUMP1',
-    'SPR_DOG_JUMP2',
-    'SPR_DOG_JUMP3',
-
-    'SPR_SS_S_1',
-    'SPR_SS_S_2',
-    'SPR_SS_S_3',
-    'SPR_SS_S_4',
-    'SPR_SS_S_5',
-    'SPR_SS_S_6',
-    'SPR_SS_S_7',
-    'SPR_SS_S_8',
-    'SPR_SS_W1_1',
-    'SPR_SS_W1_2',
-    'SPR_SS_W1_3',
-    'SPR_SS_W1_4',
-    'SPR_SS_W1_5',
-    'SPR_SS_W1_6',
-    'SPR_SS_W1_7',
-    'SPR_SS_W1_8',
-    'SPR_SS_W2_1',
-    'SPR_SS_W2_2',
-    'SPR_SS_W2_3',
-    'SPR_SS_W2_4',
-    'SPR_SS_W2_5',
-    'SPR_SS_W2_6',
-    'SPR_SS_W2_7',
-    'SPR_SS_W2_8',
-    'SPR_SS_W3_1',
-    'SPR_SS_W3_2',
-    'SPR_SS_W3_3',
-    'SPR_SS_W3_4',
-    'SPR_SS_W3_5',
-    'SPR_SS_W3_6',
-    'SPR_SS_W3_7',
-    'SPR_SS_W3_8',
-    'SPR_SS_W4_1',
-    'SPR_SS_W4_2',
-    'SPR_SS_W4_3',
-    'SPR_SS_W4_4',
-    'SPR_SS_W4_5',
-    'SPR_SS_W4_6',
-    'SPR_SS_W4_7',
-    'SPR_SS_W4_8',
-    'SPR_SS_PAIN_1',
-    'SPR_SS_DIE_1',
-    'SPR_SS_DIE_2',
-    'SPR_SS_DIE_3',
-    'SPR_SS_PAIN_2',
-    'SPR_SS_DEAD',
-    'SPR_SS_SHOOT1',
-    'SPR_SS_SHOOT2',
-    'SPR_SS_SHOOT3',
-
-    'SPR_MUT_S_1',
-    'SPR_MUT_S_2',
-    'SPR_MUT_S_3',
-    'SPR_MUT_S_4',
-    'SPR_MUT_S_5',
-    'SPR_MUT_S_6',
-    'SPR_MUT_S_7',
-    'SPR_MUT_S_8',
-    'SPR_MUT_W1_1',
-    'SPR_MUT_W1_2',
-    'SPR_MUT_W1_3',
-    'SPR_MUT_W1_4',
-    'SPR_MUT_W1_5',
-    'SPR_MUT_W1_6',
-    'SPR_MUT_W1_7',
-    'SPR_MUT_W1_8',
-    'SPR_MUT_W2_1',
-    'SPR_MUT_W2_2',
-    'SPR_MUT_W2_3',
-    'SPR_MUT_W2_4',
-    'SPR_MUT_W2_5',
-    'SPR_MUT_W2_6',
-    'SPR_MUT_W2_7',
-    'SPR_MUT_W2_8',
-    'SPR_MUT_W3_1',
-    'SPR_MUT_W3_2',
-    'SPR_MUT_W3_3',
-    'SPR_MUT_W3_4',
-    'SPR_MUT_W3_5',
-    'SPR_MUT_W3_6',
-    'SPR_MUT_W3_7',
-    'SPR_MUT_W3_8',
-    'SPR_MUT_W4_1',
-    'SPR_MUT_W4_2',
-    'SPR_MUT_W4_3',
-    'SPR_MUT_W4_4',
-    'SPR_MUT_W4_5',
-    'SPR_MUT_W4_6',
-    'SPR_MUT_W4_7',
-    'SPR_MUT_W4_8',
-    'SPR_MUT_PAIN_1',
-    'SPR_MUT_DIE_1',
-    'SPR_MUT_DIE_2',
-    'SPR_MUT_DIE_3',
-    'SPR_MUT_PAIN_2',
-    'SPR_MUT_DIE_4',
-    'SPR_MUT_DEAD',
-    'SPR_MUT_SHOOT1',
-    'SPR_MUT_SHOOT2',
-    'SPR_MUT_SHOOT3',
-    'SPR_MUT_SHOOT4',
-
-    'SPR_OFC_S_1',
-    'SPR_OFC_S_2',
-    'SPR_OFC_S_3',
-    'SPR_OFC_S_4',
-    'SPR_OFC_S_5',
-    'SPR_OFC_S_6',
-    'SPR_OFC_S_7',
-    'SPR_OFC_S_8',
-    'SPR_OFC_W1_1',
-    'SPR_OFC_W1_2',
-    'SPR_OFC_W1_3',
-    'SPR_OFC_W1_4',
-    'SPR_OFC_W1_5',
-    'SPR_OFC_W1_6',
-    'SPR_OFC_W1_7',
-    'SPR_OFC_W1_8',
-    'SPR_OFC_W2_1',
-    'SPR_OFC_W2_2',
-    'SPR_OFC_W2_3',
-    'SPR_OFC_W2_4',
-    'SPR_OFC_W2_5',
-    'SPR_OFC_W2_6',
-    'SPR_OFC_W2_7',
-    'SPR_OFC_W2_8',
-    'SPR_OFC_W3_1',
-    'SPR_OFC_W3_2',
-    'SPR_OFC_W3_3',
-    'SPR_OFC_W3_4',
-    'SPR_OFC_W3_5',
-    'SPR_OFC_W3_6',
-    'SPR_OFC_W3_7',
-    'SPR_OFC_W3_8',
-    'SPR_OFC_W4_1',
-    'SPR_OFC_W4_2',
-    'SPR_OFC_W4_3',
-    'SPR_OFC_W4_4',
-    'SPR_OFC_W4_5',
-    'SPR_OFC_W4_6',
-    'SPR_OFC_W4_7',
-    'SPR_OFC_W4_8',
-    'SPR_OFC_PAIN_1',
-    'SPR_OFC_DIE_1',
-    'SPR_OFC_DIE_2',
-    'SPR_OFC_DIE_3',
-    'SPR_OFC_PAIN_2',
-    'SPR_OFC_DIE_4',
-    'SPR_OFC_DEAD',
-    'SPR_OFC_SHOOT1',
-    'SPR_OFC_SHOOT2',
-    'SPR_OFC_SHOOT3',
-
-    'SPR_BLINKY_W1',
-    'SPR_BLINKY_W2',
-    'SPR_PINKY_W1',
-    'SPR_PINKY_W2',
-    'SPR_CLYDE_W1',
-    'SPR_CLYDE_W2',
-    'SPR_INKY_W1',
-    'SPR_INKY_W2',
-
-    'SPR_BOSS_W1',
-    'SPR_BOSS_W2',
-    'SPR_BOSS_W3',
-    'SPR_BOSS_W4',
-    'SPR_BOSS_SHOOT1',
-    'SPR_BOSS_SHOOT2',
-    'SPR_BOSS_SHOOT3',
-    'SPR_BOSS_DEAD',
-    'SPR_BOSS_DIE1',
-    'SPR_BOSS_DIE2',
-    'SPR_BOSS_DIE3',
-
-    'SPR_SCHABB_W1',
-    'SPR_SCHABB_W2',
-    'SPR_SCHABB_W3',
-    'SPR_SCHABB_W4',
-    'SPR_SCHABB_SHOOT1',
-    'SPR_SCHABB_SHOOT2',
-    'SPR_SCHABB_DIE1',
-    'SPR_SCHABB_DIE2',
-    'SPR_SCHABB_DIE3',
-    'SPR_SCHABB_DEAD',
-    'SPR_HYPO1',
-    'SPR_HYPO2',
-    'SPR_HYPO3',
-    'SPR_HYPO4',
-
-    'SPR_FAKE_W1',
-    'SPR_FAKE_W2',
-    'SPR_FAKE_W3',
-    'SPR_FAKE_W4',
-    'SPR_FAKE_SHOOT',
-    'SPR_FIRE1',
-    'SPR_FIRE2',
-    'SPR_FAKE_DIE1',
-    'SPR_FAKE_DIE2',
-    'SPR_FAKE_DIE3',
-    'SPR_FAKE_DIE4',
-    'SPR_FAKE_DIE5',
-    'SPR_FAKE_DEAD',
-
-    'SPR_MECHA_W1',
-    'SPR_MECHA_W2',
-    'SPR_MECHA_W3',
-    'SPR_MECHA_W4',
-    'SPR_MECHA_SHOOT1',
-    'SPR_MECHA_SHOOT2',
-    'SPR_MECHA_SHOOT3',
-    'SPR_MECHA_DEAD',
-    'SPR_MECHA_DIE1',
-    'SPR_MECHA_DIE2',
-    'SPR_MECHA_DIE3',
-
-    'SPR_HITLER_W1',
-    'SPR_HITLER_W2',
-    'SPR_HITLER_W3',
-    'SPR_HITLER_W4',
-    'SPR_HITLER_SHOOT1',
-    'SPR_HITLER_SHOOT2',
-    'SPR_HITLER_SHOOT3',
-    'SPR_HITLER_DEAD',
-    'SPR_HITLER_DIE1',
-    'SPR_HITLER_DIE2',
-    'SPR_HITLER_DIE3',
-    'SPR_HITLER_DIE4',
-    'SPR_HITLER_DIE5',
-    'SPR_HITLER_DIE6',
-    'SPR_HITLER_DIE7',
-
-    'SPR_GIFT_W1',
-    'SPR_GIFT_W2',
-    'SPR_GIFT_W3',
-    'SPR_GIFT_W4',
-    'SPR_GIFT_SHOOT1',
-    'SPR_GIFT_SHOOT2',
-    'SPR_GIFT_DIE1',
-    'SPR_GIFT_DIE2',
-    'SPR_GIFT_DIE3',
-    'SPR_GIFT_DEAD',
-    'SPR_ROCKET_1',
-    'SPR_ROCKET_2',
-    'SPR_ROCKET_3',
-    'SPR_ROCKET_4',
-    'SPR_ROCKET_5',
-    'SPR_ROCKET_6',
-    'SPR_ROCKET_7',
-    'SPR_ROCKET_8',
-    'SPR_SMOKE_1',
-    'SPR_SMOKE_2',
-    'SPR_SMOKE_3',
-    'SPR_SMOKE_4',
-    'SPR_BOOM_1',
-    'SPR_BOOM_2',
-    'SPR_BOOM_3',
-
-    'SPR_GRETEL_W1',
-    'SPR_GRETEL_W2',
-    'SPR_GRETEL_W3',
-    'SPR_GRETEL_W4',
-    'SPR_GRETEL_SHOOT1',
-    'SPR_GRETEL_SHOOT2',
-    'SPR_GRETEL_SHOOT3',
-    'SPR_GRETEL_DEAD',
-    'SPR_GRETEL_DIE1',
-    'SPR_GRETEL_DIE2',
-    'SPR_GRETEL_DIE3',
-
-    'SPR_FAT_W1',
-    'SPR_FAT_W2',
-    'SPR_FAT_W3',
-    'SPR_FAT_W4',
-    'SPR_FAT_SHOOT1',
-    'SPR_FAT_SHOOT2',
-    'SPR_FAT_SHOOT3',
-    'SPR_FAT_SHOOT4',
-    'SPR_FAT_DIE1',
-    'SPR_FAT_DIE2',
-    'SPR_FAT_DIE3',
-    'SPR_FAT_DEAD',
-
-    'SPR_BJ_W1',
-    'SPR_BJ_W2',
-    'SPR_BJ_W3',
-    'SPR_BJ_W4',
-    'SPR_BJ_JUMP1',
-    'SPR_BJ_JUMP2',
-    'SPR_BJ_JUMP3',
-    'SPR_BJ_JUMP4',
-
-    'SPR_KNIFEREADY',
-    'SPR_KNIFEATK1',
-    'SPR_KNIFEATK2',
-    'SPR_KNIFEATK3',
-    'SPR_KNIFEATK4',
-
-    'SPR_PISTOLREADY',
-    'SPR_PISTOLATK1',
-    'SPR_PISTOLATK2',
-    'SPR_PISTOLATK3',
-    'SPR_PISTOLATK4',
-
-    'SPR_MACHINEGUNREADY',
-    'SPR_MACHINEGUNATK1',
-    'SPR_MACHINEGUNATK2',
-    'SPR_MACHINEGUNATK3',
-    'SPR_MACHINEGUNATK4',
-
-    'SPR_CHAINREADY',
-    'SPR_CHAINATK1',
-    'SPR_CHAINATK2',
-    'SPR_CHAINATK3',
-    'SPR_CHAINATK4',
-]
+SPRITE_LABELS = _load_names('sprite_labels')
 
-SPRITE_NAMES = [
+SPRITE_NAMES = _expand_sprite_names([  # name | (prefix, frames, directions)
     'demo',
     'death_cam',
     'water_pool',
@@ -1020,336 +409,80 @@ SPRITE_NAMES = [
     'rack',
     'vines',
 
-    'guard__stand_d0',
-    'guard__stand_d1',
-    'guard__stand_d2',
-    'guard__stand_d3',
-    'guard__stand_d4',
-    'guard__stand_d5',
-    'guard__stand_d6',
-    'guard__stand_d7',
-    'guard__walk_a0_d0',
-    'guard__walk_a0_d1',
-    'guard__walk_a0_d2',
-    'guard__walk_a0_d3',
-    'guard__walk_a0_d4',
-    'guard__walk_a0_d5',
-    'guard__walk_a0_d6',
-    'guard__walk_a0_d7',
-    'guard__walk_a1_d0',
-    'guard__walk_a1_d1',
-    'guard__walk_a1_d2',
-    'guard__walk_a1_d3',
-    'guard__walk_a1_d4',
-    'guard__walk_a1_d5',
-    'guard__walk_a1_d6',
-    'guard__walk_a1_d7',
-    'guard__walk_a2_d0',
-    'guard__walk_a2_d1',
-    'guard__walk_a2_d2',
-    'guard__walk_a2_d3',
-    'guard__walk_a2_d4',
-    'guard__walk_a2_d5',
-    'guard__walk_a2_d6',
-    'guard__walk_a2_d7',
-    'guard__walk_a3_d0',
-    'guard__walk_a3_d1',
-    'guard__walk_a3_d2',
-    'guard__walk_a3_d3',
-    'guard__walk_a3_d4',
-    'guard__walk_a3_d5',
-    'guard__walk_a3_d6',
-    'guard__walk_a3_d7',
+    ('guard__stand', 0, 8),
+    ('guard__walk', 4, 8),
     'guard__pain_c1',
-    'guard__death_a0',
-    'guard__death_a1',
-    'guard__death_a2',
+    ('guard__death', 3, 0),
     'guard__pain_c2',
     'guard__dead',
-    'guard__attack_a0',
-    'guard__attack_a1',
-    'guard__attack_a2',
-
-    'dog__walk_a0_d0',
-    'dog__walk_a0_d1',
-    'dog__walk_a0_d2',
-    'dog__walk_a0_d3',
-    'dog__walk_a0_d4',
-    'dog__walk_a0_d5',
-    'dog__walk_a0_d6',
-    'dog__walk_a0_d7',
-    'dog__walk_a1_d0',
-    'dog__walk_a1_d1',
-    'dog__walk_a1_d2',
-    'dog__walk_a1_d3',
-    'dog__walk_a1_d4',
-    'dog__walk_a1_d5',
-    'dog__walk_a1_d6',
-    'dog__walk_a1_d7',
-    'dog__walk_a2_d0',
-    'dog__walk_a2_d1',
-    'dog__walk_a2_d2',
-    'dog__walk_a2_d3',
-    'dog__walk_a2_d4',
-    'dog__walk_a2_d5',
-    'dog__walk_a2_d6',
-    'dog__walk_a2_d7',
-    'dog__walk_a3_d0',
-    'dog__walk_a3_d1',
-    'dog__walk_a3_d2',
-    'dog__walk_a3_d3',
-    'dog__walk_a3_d4',
-    'dog__walk_a3_d5',
-    'dog__walk_a3_d6',
-    'dog__walk_a3_d7',
-    'dog__death_a0',
-    'dog__death_a1',
-    'dog__death_a2',
+    ('guard__attack', 3, 0),
+
+    ('dog__walk', 4, 8),
+    ('dog__death', 3, 0),
     'dog__dead',
-    'dog__attack_a0',
-    'dog__attack_a1',
-    'dog__attack_a2',
-
-    'ss__stand_d0',
-    'ss__stand_d1',
-    'ss__stand_d2',
-    'ss__stand_d3',
-    'ss__stand_d4',
-    'ss__stand_d5',
-    'ss__stand_d6',
-    'ss__stand_d7',
-    'ss__walk_a0_d0',
-    'ss__walk_a0_d1',
-    'ss__walk_a0_d2',
-    'ss__walk_a0_d3',
-    'ss__walk_a0_d4',
-    'ss__walk_a0_d5',
-    'ss__walk_a0_d6',
-    'ss__walk_a0_d7',
-    'ss__walk_a1_d0',
-    'ss__walk_a1_d1',
-    'ss__walk_a1_d2',
-    'ss__walk_a1_d3',
-    'ss__walk_a1_d4',
-    'ss__walk_a1_d5',
-    'ss__walk_a1_d6',
-    'ss__walk_a1_d7',
-    'ss__walk_a2_d0',
-    'ss__walk_a2_d1',
-    'ss__walk_a2_d2',
-    'ss__walk_a2_d3',
-    'ss__walk_a2_d4',
-    'ss__walk_a2_d5',
-    'ss__walk_a2_d6',
-    'ss__walk_a2_d7',
-    'ss__walk_a3_d0',
-    'ss__walk_a3_d1',
-    'ss__walk_a3_d2',
-    'ss__walk_a3_d3',
-    'ss__walk_a3_d4',
-    'ss__walk_a3_d5',
-    'ss__walk_a3_d6',
-    'ss__walk_a3_d7',
+    ('dog__attack', 3, 0),
+
+    ('ss__stand', 0, 8),
+    ('ss__walk', 4, 8),
     'ss__pain_c1',
-    'ss__death_a0',
-    'ss__death_a1',
-    'ss__death_a2',
+    ('ss__death', 3, 0),
     'ss__pain_c2',
     'ss__dead',
-    'ss__attack_a0',
-    'ss__attack_a1',
-    'ss__attack_a2',
-
-    'mutant__stand_d0',
-    'mutant__stand_d1',
-    'mutant__stand_d2',
-    'mutant__stand_d3',
-    'mutant__stand_d4',
-    'mutant__stand_d5',
-    'mutant__stand_d6',
-    'mutant__stand_d7',
-    'mutant__walk_a0_d0',
-    'mutant__walk_a0_d1',
-    'mutant__walk_a0_d2',
-    'mutant__walk_a0_d3',
-    'mutant__walk_a0_d4',
-    'mutant__walk_a0_d5',
-    'mutant__walk_a0_d6',
-    'mutant__walk_a0_d7',
-    'mutant__walk_a1_d0',
-    'mutant__walk_a1_d1',
-    'mutant__walk_a1_d2',
-    'mutant__walk_a1_d3',
-    'mutant__walk_a1_d4',
-    'mutant__walk_a1_d5',
-    'mutant__walk_a1_d6',
-    'mutant__walk_a1_d7',
-    'mutant__walk_a2_d0',
-    'mutant__walk_a2_d1',
-    'mutant__walk_a2_d2',
-    'mutant__walk_a2_d3',
-    'mutant__walk_a2_d4',
-    'mutant__walk_a2_d5',
-    'mutant__walk_a2_d6',
-    'mutant__walk_a2_d7',
-    'mutant__walk_a3_d0',
-    'mutant__walk_a3_d1',
-    'mutant__walk_a3_d2',
-    'mutant__walk_a3_d3',
-    'mutant__walk_a3_d4',
-    'mutant__walk_a3_d5',
-    'mutant__walk_a3_d6',
-    'mutant__walk_a3_d7',
+    ('ss__attack', 3, 0),
+
+    ('mutant__stand', 0, 8),
+    ('mutant__walk', 4, 8),
     'mutant__pain_c1',
-    'mutant__death_a0',
-    'mutant__death_a1',
-    'mutant__death_a2',
+    ('mutant__death', 3, 0),
     'mutant__pain_c2',
     'mutant__death_3',
     'mutant__dead',
-    'mutant__attack_a0',
-    'mutant__attack_a1',
-    'mutant__attack_a2',
-    'mutant__attack_a3',
-
-    'officer__stand_d0',
-    'officer__stand_d1',
-    'officer__stand_d2',
-    'officer__stand_d3',
-    'officer__stand_d4',
-    'officer__stand_d5',
-    'officer__stand_d6',
-    'officer__stand_d7',
-    'officer__walk_a0_d0',
-    'officer__walk_a0_d1',
-    'officer__walk_a0_d2',
-    'officer__walk_a0_d3',
-    'officer__walk_a0_d4',
-    'officer__walk_a0_d5',
-    'officer__walk_a0_d6',
-    'officer__walk_a0_d7',
-    'officer__walk_a1_d0',
-    'officer__walk_a1_d1',
-    'officer__walk_a1_d2',
-    'officer__walk_a1_d3',
-    'officer__walk_a1_d4',
-    'officer__walk_a1_d5',
-    'officer__walk_a1_d6',
-    'officer__walk_a1_d7',
-    'officer__walk_a2_d0',
-    'officer__walk_a2_d1',
-    'officer__walk_a2_d2',
-    'officer__walk_a2_d3',
-    'officer__walk_a2_d4',
-    'officer__walk_a2_d5',
-    'officer__walk_a2_d6',
-    'officer__walk_a2_d7',
-    'officer__walk_a3_d0',
-    'officer__walk_a3_d1',
-    'officer__walk_a3_d2',
-    'officer__walk_a3_d3',
-    'officer__walk_a3_d4',
-    'officer__walk_a3_d5',
-    'officer__walk_a3_d6',
-    'officer__walk_a3_d7',
+    ('mutant__attack', 4, 0),
+
+    ('officer__stand', 0, 8),
+    ('officer__walk', 4, 8),
     'officer__pain_c1',
-    'officer__death_a0',
-    'officer__death_a1',
-    'officer__death_a2',
+    ('officer__death', 3, 0),
     'officer__pain_c2',
     'officer__death_a3',
     'officer__dead',
-    'officer__attack_a0',
-    'officer__attack_a1',
-    'officer__attack_a2',
-
-    'ghost_blinky__walk_a0',
-    'ghost_blinky__walk_a1',
-    'ghost_pinky__walk_a0',
-    'ghost_pinky__walk_a1',
-    'ghost_clyde__walk_a0',
-    'ghost_clyde__walk_a1',
-    'ghost_inky__walk_a0',
-    'ghost_inky__walk_a1',
-
-    'hans__walk_a0',
-    'hans__walk_a1',
-    'hans__walk_a2',
-    'hans__walk_a3',
-    'hans__attack_a0',
-    'hans__attack_a1',
-    'hans__attack_a2',
+    ('officer__attack', 3, 0),
+
+    ('ghost_blinky__walk', 2, 0),
+    ('ghost_pinky__walk', 2, 0),
+    ('ghost_clyde__walk', 2, 0),
+    ('ghost_inky__walk', 2, 0),
+
+    ('hans__walk', 4, 0),
+    ('hans__attack', 3, 0),
     'hans__dead',
-    'hans__death_a0',
-    'hans__death_a1',
-    'hans__death_a2',
-
-    'schabbs__walk_a0',
-    'schabbs__walk_a1',
-    'schabbs__walk_a2',
-    'schabbs__walk_a3',
-    'schabbs__attack_a0',
-    'schabbs__attack_a1',
-    'schabbs__death_a0',
-    'schabbs__death_a1',
-    'schabbs__death_a2',
+    ('hans__death', 3, 0),
+
+    ('schabbs__walk', 4, 0),
+    ('schabbs__attack', 2, 0),
+    ('schabbs__death', 3, 0),
     'schabbs__dead',
-    'needle__fly_a0',
-    'needle__fly_a1',
-    'needle__fly_a2',
-    'needle__fly_a3',
-
-    'robed_fake__walk_a0',
-    'robed_fake__walk_a1',
-    'robed_fake__walk_a2',
-    'robed_fake__walk_a3',
-    'robed_fake__attack_a0',
-    'fire__fly_a0',
-    'fire__fly_a1',
-    'robed_fake__death_a0',
-    'robed_fake__death_a1',
-    'robed_fake__death_a2',
-    'robed_fake__death_a3',
-    'robed_fake__death_a4',
+    ('needle__fly', 4, 0),
+
+    ('robed_fake__walk', 4, 0),
+    ('robed_fake__attack', 1, 0),
+    ('fire__fly', 2, 0),
+    ('robed_fake__death', 5, 0),
     'robed_fake__dead',
 
-    'mecha_hitler__walk_a0',
-    'mecha_hitler__walk_a1',
-    'mecha_hitler__walk_a2',
-    'mecha_hitler__walk_a3',
-    'mecha_hitler__attack_a0',
-    'mecha_hitler__attack_a1',
-    'mecha_hitler__attack_a2',
+    ('mecha_hitler__walk', 4, 0),
+    ('mecha_hitler__attack', 3, 0),
     'mecha_hitler__dead',
-    'mecha_hitler__death_a0',
-    'mecha_hitler__death_a1',
-    'mecha_hitler__death_a2',
-
-    'hitler__walk_a0',
-    'hitler__walk_a1',
-    'hitler__walk_a2',
-    'hitler__walk_a3',
-    'hitler__attack_a0',
-    'hitler__attack_a1',
-    'hitler__attack_a2',
+    ('mecha_hitler__death', 3, 0),
+
+    ('hitler__walk', 4, 0),
+    ('hitler__attack', 3, 0),
     'hitler__dead',
-    'hitler__death_a0',
-    'hitler__death_a1',
-    'hitler__death_a2',
-    'hitler__death_a3',
-    'hitler__death_a4',
-    'hitler__death_a5',
-    'hitler__death_a6',
-
-    'otto__walk_a0',
-    'otto__walk_a1',
-    'otto__walk_a2',
-    'otto__walk_a3',
-    'otto__attack_a0',
-    'otto__attack_a1',
-    'otto__death_a0',
-    'otto__death_a1',
-    'otto__death_a2',
+    ('hitler__death', 7, 0),
+
+    ('otto__walk', 4, 0),
+    ('otto__attack', 2, 0),
+    ('otto__death', 3, 0),
     'otto__dead',
     'rocket__fly_d0',
     'rocket__fly_d1',
@@ -1359,318 +492,57 @@ SPRITE_NAMES = [
     'rocket__fly_d6',
     'rocket__fly_d5',
     'rocket__fly_d4',
-    'smoke__fly_a0',
-    'smoke__fly_a1',
-    'smoke__fly_a2',
-    'smoke__fly_a3',
-    'boom__fly_a0',
-    'boom__fly_a1',
-    'boom__fly_a2',
-
-    'gretel__walk_a0',
-    'gretel__walk_a1',
-    'gretel__walk_a2',
-    'gretel__walk_a3',
-    'gretel__attack_a0',
-    'gretel__attack_a1',
-    'gretel__attack_a2',
+    ('smoke__fly', 4, 0),
+    ('boom__fly', 3, 0),
+
+    ('gretel__walk', 4, 0),
+    ('gretel__attack', 3, 0),
     'gretel__dead',
-    'gretel__death_a0',
-    'gretel__death_a1',
-    'gretel__death_a2',
-
-    'fettgesicht__walk_a0',
-    'fettgesicht__walk_a1',
-    'fettgesicht__walk_a2',
-    'fettgesicht__walk_a3',
-    'fettgesicht__attack_a0',
-    'fettgesicht__attack_a1',
-    'fettgesicht__attack_a2',
-    'fettgesicht__attack_a3',
-    'fettgesicht__death_a0',
-    'fettgesicht__death_a1',
-    'fettgesicht__death_a2',
+    ('gretel__death', 3, 0),
+
+    ('fettgesicht__walk', 4, 0),
+    ('fettgesicht__attack', 4, 0),
+    ('fettgesicht__death', 3, 0),
     'fettgesicht__dead',
 
-    'bj__run_a0',
-    'bj__run_a1',
-    'bj__run_a2',
-    'bj__run_a3',
-    'bj__jump_a0',
-    'bj__jump_a1',
-    'bj__jump_a2',
-    'bj__jump_a3',
+    ('bj__run', 4, 0),
+    ('bj__jump', 4, 0),
 
     'knife__ready',
-    'knife__attack_a0',
-    'knife__attack_a1',
-    'knife__attack_a2',
-    'knife__attack_a3',
+    ('knife__attack', 4, 0),
 
     'pistol__ready',
-    'pistol__attack_a0',
-    'pistol__attack_a1',
-    'pistol__attack_a2',
-    'pistol__attack_a3',
+    ('pistol__attack', 4, 0),
 
     'machinegun__ready',
-    'machinegun__attack_a0',
-    'machinegun__attack_a1',
-    'machinegun__attack_a2',
-    'machinegun__attack_a3',
+    ('machinegun__attack', 4, 0),
 
     'chaingun__ready',
-    'chaingun__attack_a0',
-    'chaingun__attack_a1',
-    'chaingun__attack_a2',
-    'chaingun__attack_a3',
-]
+    ('chaingun__attack', 4, 0),
+])
 
 
-SCREEN_NAMES = [
+SCREEN_NAMES = _intern_names([
     'exit',
     'error',
-]
+])
 
 
-AUDIO_PARTITIONS_MAP = {
+AUDIO_PARTITIONS_MAP = MappingProxyType({
     'buzzer':   (  0,  87),
     'adlib':    ( 87,  87),
     'digital':  (174,  87),
     'music':    (261,  27),
-}
+})
 
-SOUND_LABELS = [
-    'HITWALLSND',
-    'SELECTWPNSND',
-    'SELECTITEMSND',
-    'HEARTBEATSND',
-    'MOVEGUN2SND',
-    'MOVEGUN1SND',
-    'NOWAYSND',
-    'NAZIHITPLAYERSND',
-    'SCHABBSTHROWSND',
-    'PLAYERDEATHSND',
-    'DOGDEATHSND',
-    'ATKGATLINGSND',
-    'GETKEYSND',
-    'NOITEMSND',
-    'WALK1SND',
-    'WALK2SND',
-    'TAKEDAMAGESND',
-    'GAMEOVERSND',
-    'OPENDOORSND',
-    'CLOSEDOORSND',
-    'DONOTHINGSND',
-    'HALTSND',
-    'DEATHSCREAM2SND',
-    'ATKKNIFESND',
-    'ATKPISTOLSND',
-    'DEATHSCREAM3SND',
-    'ATKMACHINEGUNSND',
-    'HITENEMYSND',
-    'SHOOTDOORSND',
-    'DEATHSCREAM1SND',
-    'GETMACHINESND',
-    'GETAMMOSND',
-    'SHOOTSND',
-    'HEALTH1SND',
-    'HEALTH2SND',
-    'BONUS1SND',
-    'BONUS2SND',
-    'BONUS3SND',
-    'GETGATLINGSND',
-    'ESCPRESSEDSND',
-    'LEVELDONESND',
-    'DOGBARKSND',
-    'ENDBONUS1SND',
-    'ENDBONUS2SND',
-    'BONUS1UPSND',
-    'BONUS4SND',
-    'PUSHWALLSND',
-    'NOBONUSSND',
-    'PERCENT100SND',
-    'BOSSACTIVESND',
-    'MUTTISND',
-    'SCHUTZADSND',
-    'AHHHGSND',
-    'DIESND',
-    'EVASND',
-    'GUTENTAGSND',
-    'LEBENSND',
-    'SCHEISTSND',
-    'NAZIFIRESND',
-    'BOSSFIRESND',
-    'SSFIRESND',
-    'SLURPIESND',
-    'TOT_HUNDSND',
-    'MEINGOTTSND',
-    'SCHABBSHASND',
-    'HITLERHASND',
-    'SPIONSND',
-    'NEINSOVASSND',
-    'DOGATTACKSND',
-    'FLAMETHROWERSND',
-    'MECHSTEPSND',
-    'GOOBSSND',
-    'YEAHSND',
-    'DEATHSCREAM4SND',
-    'DEATHSCREAM5SND',
-    'DEATHSCREAM6SND',
-    'DEATHSCREAM7SND',
-    'DEATHSCREAM8SND',
-    'DEATHSCREAM9SND',
-    'DONNERSND',
-    'EINESND',
-    'ERLAUBENSND',
-    'KEINSND',
-    'MEINSND',
-    'ROSESND',
-    'MISSILEFIRESND',
-    'MISSILEHITSND',
-]
+SOUND_LABELS = _load_names('sound_labels')
 
-SOUND_NAMES = [
-    'player__wall_hit',
-    '_SELECTWPNSND',
-    '_SELECTITEMSND',
-    '_HEARTBEATSND',
-    'menu__half_step',
-    'menu__step',
-    'player__no_way',
-    '_NAZIHITPLAYERSND',
-    'schabbs__attack',
-    'player__death',
-    'dog__death',
-    'chaingun__attack',
-    'pickup__key',
-    '_NOITEMSND',
-    '_WALK1SND',
-    '_WALK2SND',
-    '_TAKEDAMAGESND',
-    '_GAMEOVERSND',
-    'door__open',
-    'door__close',
-    'player__do_nothing',
-    'guard__wake',
-    'guard__death_2',
-    'knife__attack',
-    'pistol__attack',
-    'guard__death_3',
-    'machinegun__attack',
-    '_HITENEMYSND',
-    'menu__bind',
-    'guard__death_1',
-    'pickup__machinegun',
-    'pickup__ammo',
-    'menu__select',
-    'pickup__food',
-    'pickup__medkit',
-    'pickup__cross',
-    'pickup__chalice',
-    'pickup__jewels',
-    'pickup__chaingun',
-    'menu__exit',
-    'elevator__use',
-    'dog__wake',
-    'score__bonus_tens',
-    'score__bonus_got',
-    'pickup__extra_life',
-    'pickup__crown',
-    'pushwall__move',
-    'score__no_bonus',
-    'score__100',
-    '_BOSSACTIVESND',
-    'hans__death',
-    'ss__wake',
-    'mutant__death',
-    'hitler__wake',
-    'hitler__death',
-    'hans__wake',
-    'ss__death',
-    'mecha_hitler__death',
-    'guard__attack',
-    'boss__gun_attack',
-    'ss__attack',
-    'blood__slurpie',
-    'robed_fake__wake',
-    'schabbs__death',
-    'schabbs__wake',
-    'robed_fake__death',
-    'officer__wake',
-    'officer__death',
-    'dog__attack',
-    'robed_fake__attack',
-    'mecha_hitler__step',
-    '_GOOBSSND',
-    'bj__yeah',
-    'guard__death_4',
-    'guard__death_5',
-    'secret__death',
-    'guard__death_6',
-    'guard__death_7',
-    'guard__death_8',
-    'otto__death',
-    'otto__wake',
-    'fettgesicht__wake',
-    'gretel__wake',
-    'gretel__death',
-    'fettgesicht__death',
-    'boss__missile_attack',
-    'missile__hit',
-]
+SOUND_NAMES = _load_names('sound_names')
 
 
 SAMPLED_SOUND_FREQUENCY = 7042
 
-SAMPLED_SOUND_LABELS = [
-    'HALTSND',
-    'DOGBARKSND',
-    'CLOSEDOORSND',
-    'OPENDOORSND',
-    'ATKMACHINEGUNSND',
-    'ATKPISTOLSND',
-    'ATKGATLINGSND',
-    'SCHUTZADSND',
-    'GUTENTAGSND',
-    'MUTTISND',
-    'BOSSFIRESND',
-    'SSFIRESND',
-    'DEATHSCREAM1SND',
-    'DEATHSCREAM2SND',
-    'DEATHSCREAM3SND',
-    'PUSHWALLSND',
-    'DOGDEATHSND',
-    'AHHHGSND',
-    'DIESND',
-    'EVASND',
-    'LEBENSND',
-    'NAZIFIRESND',
-    'SLURPIESND',
-    'TOT_HUNDSND',
-    'MEINGOTTSND',
-    'SCHABBSHASND',
-    'HITLERHASND',
-    'SPIONSND',
-    'NEINSOVASSND',
-    'DOGATTACKSND',
-    'LEVELDONESND',
-    'MECHSTEPSND',
-    'YEAHSND',
-    'SCHEISTSND',
-    'DEATHSCREAM4SND',
-    'DEATHSCREAM5SND',
-    'DONNERSND',
-    'EINESND',
-    'ERLAUBENSND',
-    'DEATHSCREAM6SND',
-    'DEATHSCREAM7SND',
-    'DEATHSCREAM8SND',
-    'DEATHSCREAM9SND',
-    'KEINSND',
-    'MEINSND',
-    'ROSESND',
-]
+SAMPLED_SOUND_LABELS = _load_names('sampled_sound_labels')
 
 SAMPLED_SOUND_INDICES = [SOUND_LABELS.index(label) for label in SAMPLED_SOUND_LABELS]
 SAMPLED_SOUND_NAMES = [SOUND_NAMES[i] for i in SAMPLED_SOUND_INDICES]
@@ -1679,6 +551,7 @@ SAMPLED_SOUND_NAMES = [SOUND_NAMES[i] for i in SAMPLED_SOUND_INDICES]
 BUZZER_SOUND_LABELS = SOUND_LABELS
 BUZZER_SOUND_INDICES = tuple(range(len(SOUND_LABELS)))
 BUZZER_SOUND_NAMES = SOUND_NAMES
+assert len(BUZZER_SOUND_NAMES) == len(BUZZER_SOUND_LABELS) == AUDIO_PARTITIONS_MAP['buzzer'][1]
 
 
 ADLIB_SOUND_LABELS = BUZZER_SOUND_LABELS
@@ -1686,68 +559,12 @@ ADLIB_SOUND_INDICES = BUZZER_SOUND_INDICES
 ADLIB_SOUND_NAMES = BUZZER_SOUND_NAMES
 
 
-MUSIC_LABELS = [
-    'CORNER_MUS',
-    'DUNGEON_MUS',
-    'WARMARCH_MUS',
-    'GETTHEM_MUS',
-    'HEADACHE_MUS',
-    'HITLWLTZ_MUS',
-    'INTROCW3_MUS',
-    'NAZI_NOR_MUS',
-    'NAZI_OMI_MUS',
-    'POW_MUS',
-    'SALUTE_MUS',
-    'SEARCHN_MUS',
-    'SUSPENSE_MUS',
-    'VICTORS_MUS',
-    'WONDERIN_MUS',
-    'FUNKYOU_MUS',
-    'ENDLEVEL_MUS',
-    'GOINGAFT_MUS',
-    'PREGNANT_MUS',
-    'ULTIMATE_MUS',
-    'NAZI_RAP_MUS',
-    'ZEROHOUR_MUS',
-    'TWELFTH_MUS',
-    'ROSTER_MUS',
-    'URAHERO_MUS',
-    'VICMARCH_MUS',
-    'PACMAN_MUS',
-]
+MUSIC_LABELS = _load_names('music_labels')
 
-MUSIC_NAMES = [
-    'Enemy Around the Corner',
-    'Into the Dungeons',
-    'The March to War',
-    'Get Them Before They Get You',
-    'Pounding Headache',
-    'Hitler Waltz',
-    'Kill the S.O.B.',
-    'Horst-Wessel-Lied',
-    'Nazi Anthem',
-    'P.O.W.',
-    'Salute',
-    'Searching For the Enemy',
-    'Suspense',
-    'Victors',
-    'Wondering About My Loved Ones',
-    'Funk You!',
-    'End of Level',
-    'Going After Hitler',
-    'Lurking...',
-    'The Ultimate Challenge',
-    'The Nazi Rap',
-    'Zero Hour',
-    'Twelfth Hour',
-    'Roster',
-    'U R A Hero',
-    'Victory March',
-    'Wolf Pac',
-]
+MUSIC_NAMES = _load_names('music_names')
 
 
-TILE_PARTITION_MAP = {
+TILE_PARTITION_MAP = MappingProxyType({
     'wall':             (  1,  49),
 
     'door_panel':       ( 50,   1),
@@ -1763,7 +580,7 @@ TILE_PARTITION_MAP = {
     'deaf':             (106,   1),
     'secret':           (107,   1),
     'area':             (107,  36),
-}
+})
 
 DOOR_MAP = {  # {tile: (name, vertical)}
     90:  ('door',          'door_panel',    True),
@@ -1776,7 +593,7 @@ DOOR_MAP = {  # {tile: (name, vertical)}
     101: ('door_elevator', 'door_elevator', False),
 }
 
-ENTITY_PARTITION_MAP = {  # TODO
+ENTITY_PARTITION_MAP = MappingProxyType({  # TODO
     'start':        ( 19,   4),
     'turn':         ( 90,   8),
     'pushwall':     ( 98,   1),
@@ -1784,7 +601,7 @@ ENTITY_PARTITION_MAP = {  # TODO
     'object':       ( 23,  48),
     'enemy':        (100, 200),  # broad range
     'dead_guard':   (124,   1),  # inside of enemies, whatever...
-}
+})
 
 ENTITY_OBJECT_MAP = {
     23: 'water_pool',
@@ -2061,7 +878,7 @@ CEILING_COLORS = [
 ]
 
 
-STATIC_OBJECT_NAMES = [
+STATIC_OBJECT_NAMES = _intern_names([
     'armor',
     'barrel',
     'basket',
@@ -2098,9 +915,10 @@ STATIC_OBJECT_NAMES = [
     'water_pool',
     'well',
     'well__water',
-]
+])
+STATIC_OBJECT_NAMES_SET = frozenset(STATIC_OBJECT_NAMES)
 
-SOLID_OBJECT_NAMES = [
+SOLID_OBJECT_NAMES = _intern_names([
     'armor',
     'barrel',
     'bed',
@@ -2121,9 +939,10 @@ SOLID_OBJECT_NAMES = [
     'vase',
     'well',
     'well__water',
-]
+])
+SOLID_OBJECT_NAMES_SET = frozenset(SOLID_OBJECT_NAMES)
 
-COLLECTABLE_OBJECT_NAMES = [
+COLLECTABLE_OBJECT_NAMES = _intern_names([
     'ammo',
     'ammo_used',
     'chaingun',
@@ -2138,7 +957,8 @@ COLLECTABLE_OBJECT_NAMES = [
     'machinegun',
     'medkit',
     'silver_key',
-]
+])
+COLLECTABLE_OBJECT_NAMES_SET = frozenset(COLLECTABLE_OBJECT_NAMES)
 
 COLLECTABLE_PICKUP_SOUNDS = {
     'ammo':       'pickup__ammo',
@@ -2305,6 +1125,14 @@ ENEMY_DESCRIPTORS = {
 }
 
 ENEMY_NAMES = list(sorted(ENEMY_DESCRIPTORS.keys()))
+ENEMY_NAMES_SET = frozenset(ENEMY_NAMES)
+
+OBJECT_CATEGORY_MAP = MappingProxyType(dict(itertools.chain(  # {name: category}, most specific wins
+    ((name, 'enemy') for name in ENEMY_NAMES),
+    ((name, 'collectable') for name in COLLECTABLE_OBJECT_NAMES),
+    ((name, 'static') for name in STATIC_OBJECT_NAMES),
+    ((name, 'solid') for name in SOLID_OBJECT_NAMES),
+)))
 
 OBJECT_STATES = {  # (rotate, sprite, ticks, think, action, next)
     'boom': {
@@ -1,100 +1,338 @@
 import array
-import io
+import functools
+import itertools
+import math
+import operator
+import struct
+import sys
 
-from pywolf.utils import (
-    stream_pack, stream_pack_array, stream_unpack, stream_unpack_array,
-    BinaryResource, ResourceManager
-)
+from pywolf.utils import stream_read, stream_write, BinaryResource, ResourceManager
 
 
 VERTICAL = 0
 HORIZONTAL = 1
 
 
+@functools.lru_cache()
+def tilemap_header_struct(planes_count):
+    return struct.Struct('<{0:d}L{0:d}HHH16s'.format(planes_count))
+
+
+def tile_lut(codes, value=1, size=0x10000):
+    lut = bytearray(size)
+    for code in codes:
+        lut[code] = value
+    return bytes(lut)
+
+
 class TileMapHeader(BinaryResource):
 
+    __slots__ = ('plane_offsets', 'plane_sizes', 'size', 'name', '_packed', '_packed_fields')
+
     def __init__(self, plane_offsets, plane_sizes, size, name):
-        self.plane_offsets = plane_offsets
-        self.plane_sizes = plane_sizes
-        self.size = size
+        self.plane_offsets = tuple(plane_offsets)
+        self.plane_sizes = tuple(plane_sizes)
+        self.size = tuple(size)
         self.name = name
+        self._packed = None
+        self._packed_fields = None
 
     @classmethod
     def from_stream(cls, stream, planes_count=3):
         planes_count = int(planes_count)
         assert planes_count > 0
-        plane_offsets = tuple(stream_unpack_array('<L', stream, planes_count))
-        plane_sizes = tuple(stream_unpack_array('<H', stream, planes_count))
-        size = stream_unpack('<HH', stream)
-        name = stream_unpack('<16s', stream)[0].decode('ascii')
-        null_char_index = name.find('\0')
-        if null_char_index >= 0:
-            name = name[:null_char_index]
-        name = name.rstrip(' \t\r\n\v\0')
-        return cls(plane_offsets, plane_sizes, size, name)
+        header_struct = tilemap_header_struct(planes_count)
+        return cls._unpack(header_struct.unpack(stream_read(stream, header_struct.size)), planes_count)
 
     def to_stream(self, stream):
-        stream_pack_array(stream, '<L', self.plane_offsets)
-        stream_pack_array(stream, '<H', self.plane_sizes)
-        stream_pack(stream, '<HH', *self.size)
-        stream_pack(stream, '<16s', self.name.encode('ascii'))
+        stream_write(stream, self.to_bytes())
+
+    def to_bytes(self):
+        fields = (tuple(self.plane_offsets), tuple(self.plane_sizes), tuple(self.size), self.name)
+        packed = self._packed
+        if packed is None or fields != self._packed_fields:  # repacked only after changes
+            planes_count = len(self.plane_offsets)
+            assert len(self.plane_sizes) == planes_count
+            header_struct = tilemap_header_struct(planes_count)
+            packed = header_struct.pack(*self.plane_offsets, *self.plane_sizes, *self.size,
+                                        self.name.encode('ascii'))
+            self._packed = packed
+            self._packed_fields = fields
+        return packed
+
+    @classmethod
+    def from_bytes(cls, data, planes_count=3, offset=0):
+        planes_count = int(planes_count)
+        assert planes_count > 0
+        header_struct = tilemap_header_struct(planes_count)
+        return cls._unpack(header_struct.unpack_from(data, offset), planes_count)
 
     @classmethod
-    def from_bytes(cls, data, planes_count=3):
-        return cls.from_stream(io.BytesIO(data), planes_count)
+    def _unpack(cls, fields, planes_count):
+        plane_offsets = fields[:planes_count]
+        plane_sizes = fields[planes_count:(planes_count * 2)]
+        size = fields[(planes_count * 2):(planes_count * 2 + 2)]
+        name = fields[-1].partition(b'\0')[0].rstrip(b' \t\r\n\v').decode('ascii')
+        return cls(plane_offsets, plane_sizes, size, name)
 
 
 class TileMap(object):
 
+    __slots__ = ('size', 'name', 'cube', 'planes', '_width', '_height', '_area', '_row_offsets')
+
     def __init__(self, size, planes, name):
         width, height = size
         area = width * height
+
+        assert area
         assert all(len(plane) == area for plane in planes)
+        cube = array.array('H')
+        for plane in planes:
+            try:
+                plane_view = memoryview(plane)
+            except TypeError:  # plain sequence
+                cube.extend(plane)
+            else:
+                if plane_view.itemsize == cube.itemsize:
+                    cube.frombytes(plane_view.cast('B'))
+                else:
+                    cube.extend(plane_view)
+        self._init_cube(size, cube, name)
+
+    @classmethod
+    def from_cube(cls, size, cube, name):
+        width, height = size
+        area = width * height
+        assert area
+        assert isinstance(cube, array.array)
+        assert len(cube) % area == 0
+        if cube.typecode != 'H':
+            cube = array.array('H', cube)
+        self = cls.__new__(cls)
+        self._init_cube(size, cube, name)
+        return self
 
+    def _init_cube(self, size, cube, name):
+        width, height = size
+        area = width * height
         self.size = size
         self.name = name
-        self.planes = planes
+        self._width = width
+        self._height = height
+        self._area = area
+        self._row_offsets = tuple(range(0, area, width))
+        cube_view = memoryview(cube)
+        self.cube = cube  # planes * height * width
+        # Live views: writes go to the cube, which cannot be resized while they exist
+        self.planes = [cube_view[(i * area):((i + 1) * area)] for i in range(len(cube) // area)]
+
+    @property
+    def dimensions(self):  # legacy alias of size
+        return self.size
 
     def __getitem__(self, key):
-        planes = self.planes
-        height = self.size[1]
-        assert 2 <= len(key) <= 3
-
-        tile_x, tile_y, *args = key
-        tile_offset = tile_y * height + tile_x
-        if args:
-            plane_index = args[0]
-            return planes[plane_index][tile_offset]
+        if len(key) == 3:
+            tile_x, tile_y, plane_index = key
         else:
-            return [planes[i][tile_offset] for i in range(len(planes))]
+            tile_x, tile_y = key
+            plane_index = None
 
-    def __settitem__(self, key, value):
-        planes = self.planes
-        height = self.size[1]
-        assert 2 <= len(key) <= 3
-
-        tile_x, tile_y, *args = key
-        tile_offset = tile_y * height + tile_x
-        if args:
-            plane_index = args[0]
-            planes[plane_index][tile_offset] = value
+        if isinstance(tile_x, slice) or isinstance(tile_y, slice):
+            if not isinstance(tile_x, slice):
+                tile_x = slice(tile_x, tile_x + 1)
+            if not isinstance(tile_y, slice):
+                tile_y = slice(tile_y, tile_y + 1)
+            x0, x1, x_step = tile_x.indices(self._width)
+            y0, y1, y_step = tile_y.indices(self._height)
+            assert x_step == 1 and y_step == 1
+            return self.region(x0, y0, x1, y1, plane_index)
+
+        tile_offset = tile_y * self._width + tile_x
+        if plane_index is None:
+            return self.cube[tile_offset::self._area].tolist()
+        else:
+            return self.planes[plane_index][tile_offset]
+
+    def __setitem__(self, key, value):
+        if len(key) == 3:
+            tile_x, tile_y, plane_index = key
         else:
-            assert len(value) == len(planes)
-            for i in range(len(planes)):
-                planes[i][tile_offset] = value[i]
+            tile_x, tile_y = key
+            plane_index = None
+
+        tile_offset = tile_y * self._width + tile_x
+        if plane_index is None:
+            assert len(value) == len(self.planes)
+            self.cube[tile_offset::self._area] = array.array('H', value)
+        else:
+            self.planes[plane_index][tile_offset] = value
+
+    def get_tile(self, tile_x, tile_y, plane_index):
+        return self.planes[plane_index][tile_y * self._width + tile_x]
+
+    def set_tile(self, tile_x, tile_y, plane_index, value):
+        self.planes[plane_index][tile_y * self._width + tile_x] = value
 
     def get(self, key, default=None):
-        width, height = self.size
-        tile_x, tile_y, *_ = key
-        tile_offset = tile_y * height + tile_x
-        if 0 <= tile_offset < (width * height):
-            return self[key]
+        if len(key) == 3:
+            tile_x, tile_y, plane_index = key
+        else:
+            tile_x, tile_y = key
+            plane_index = None
+
+        width = self._width
+        if 0 <= tile_x < width and 0 <= tile_y < self._height:
+            tile_offset = tile_y * width + tile_x
+            if plane_index is None:
+                return self.cube[tile_offset::self._area].tolist()
+            else:
+                return self.planes[plane_index][tile_offset]
         else:
             return default
 
+    def region(self, x0, y0, x1, y1, plane_index=None):
+        planes = self.planes
+        width = self._width
+        if plane_index is None:
+            return [self.region(x0, y0, x1, y1, i) for i in range(len(planes))]
+        else:
+            plane = planes[plane_index]
+            return [plane[(y * width + x0):(y * width + x1)].tolist() for y in range(y0, y1)]
+
+    def gather(self, tiles_x, tiles_y, plane_index):
+        tile_offsets = map(operator.add, map(self._row_offsets.__getitem__, tiles_y), tiles_x)
+        return list(map(self.planes[plane_index].__getitem__, tile_offsets))
+
+    def gather_safe(self, tiles_x, tiles_y, plane_index, default=0):
+        plane = self.planes[plane_index]
+        width = self._width
+        height = self._height
+        return [plane[tile_y * width + tile_x] if 0 <= tile_x < width and 0 <= tile_y < height else default
+                for tile_x, tile_y in zip(tiles_x, tiles_y)]
+
+    def column(self, x, y0, y1, plane_index=None):
+        planes = self.planes
+        width = self._width
+        if plane_index is None:
+            return [self.column(x, y0, y1, i) for i in range(len(planes))]
+        else:
+            return planes[plane_index][(y0 * width + x):(y1 * width + x):width].tolist()
+
+    def iter_tiles_in_region(self, x0, y0, x1, y1, plane_index=None):
+        planes = self.planes
+        width = self._width
+        tiles_x = range(x0, x1)
+        for tile_y in range(y0, y1):
+            row_start = tile_y * width
+            coords = zip(tiles_x, itertools.repeat(tile_y))
+            if plane_index is None:
+                rows = [plane[(row_start + x0):(row_start + x1)] for plane in planes]
+                yield from zip(coords, zip(*rows))
+            else:
+                yield from zip(coords, planes[plane_index][(row_start + x0):(row_start + x1)])
+
+    def find_all(self, value, plane_index):
+        width = self._width
+        tiles_x = []
+        tiles_y = []
+        if not 0 <= value <= 0xFFFF:
+            return tiles_x, tiles_y
+
+        data = self.planes[plane_index].tobytes()
+        find = data.find
+        pattern = struct.pack('=H', value)
+        found = find(pattern)
+        while found >= 0:
+            if found & 1:  # straddles two tiles
+                found = find(pattern, found + 1)
+            else:
+                tile_y, tile_x = divmod(found >> 1, width)
+                tiles_x.append(tile_x)
+                tiles_y.append(tile_y)
+                found = find(pattern, found + 2)
+        return tiles_x, tiles_y
+
+    def _narrow_plane(self, plane_index):
+        # Private 8-bit copy of a plane whose tiles all fit; rebuilt on each call, so it never goes stale
+        data = self.planes[plane_index].tobytes()
+        if sys.byteorder == 'little':
+            low, high = data[0::2], data[1::2]
+        else:
+            low, high = data[1::2], data[0::2]
+        if high.count(0) == len(high):
+            return low
+        return None
+
+    def classify(self, lut, plane_index):
+        narrow = self._narrow_plane(plane_index)
+        if narrow is not None:
+            return narrow.translate(lut[:0x100])
+        else:
+            return bytes(map(lut.__getitem__, self.planes[plane_index]))
+
+    def cast_column(self, origin_x, origin_y, angle, lut, plane_index=0, max_distance=None):
+        # Angle in degrees, counter-clockwise from east, with north towards -Y as in the original engine
+        width = self._width
+        height = self._height
+        plane = self.planes[plane_index]
+        if max_distance is None:
+            max_distance = width + height
+
+        radians = math.radians(angle)
+        dir_x = math.cos(radians)
+        dir_y = -math.sin(radians)
+        tile_x = int(origin_x)
+        tile_y = int(origin_y)
+
+        if dir_x < 0:
+            step_x = -1
+            delta_x = -1 / dir_x
+            side_x = (origin_x - tile_x) * delta_x
+        elif dir_x > 0:
+            step_x = 1
+            delta_x = 1 / dir_x
+            side_x = (tile_x + 1 - origin_x) * delta_x
+        else:
+            step_x = 0
+            side_x = math.inf
+
+        if dir_y < 0:
+            step_y = -1
+            delta_y = -1 / dir_y
+            side_y = (origin_y - tile_y) * delta_y
+        elif dir_y > 0:
+            step_y = 1
+            delta_y = 1 / dir_y
+            side_y = (tile_y + 1 - origin_y) * delta_y
+        else:
+            step_y = 0
+            side_y = math.inf
+
+        while True:
+            if side_x < side_y:
+                distance = side_x
+                side_x += delta_x
+                tile_x += step_x
+                side = VERTICAL
+            else:
+                distance = side_y
+                side_y += delta_y
+                tile_y += step_y
+                side = HORIZONTAL
+
+            if distance > max_distance or not (0 <= tile_x < width and 0 <= tile_y < height):
+                return None
+            tile = plane[tile_y * width + tile_x]
+            if lut[tile]:
+                return distance, tile, side
+
+    def cast_columns(self, origin_x, origin_y, angles, lut, plane_index=0, max_distance=None):
+        cast_column = self.cast_column
+        return [cast_column(origin_x, origin_y, angle, lut, plane_index, max_distance) for angle in angles]
+
     def check_coords(self, tile_coords):
-        return (0 <= tile_coords[0] < self.size[0] and
-                0 <= tile_coords[1] < self.size[1])
+        return (0 <= tile_coords[0] < self._width and
+                0 <= tile_coords[1] < self._height)
 
 
 class TileMapManager(ResourceManager):
@@ -104,17 +342,80 @@ class TileMapManager(ResourceManager):
 
     def _load_resource(self, index, chunk):
         header, raw_planes = chunk
-        planes = [array.array('H', raw_plane) for raw_plane in raw_planes]
-        return TileMap(header.size, planes, header.name)
+        cube = array.array('H')
+        for raw_plane in raw_planes:
+            cube.frombytes(raw_plane)
+        if sys.byteorder != 'little':
+            cube.byteswap()
+        return TileMap.from_cube(header.size, cube, header.name)
+
+
+class EntityTable(object):
+
+    __slots__ = ('poses_x', 'poses_y', 'poses_angle', 'healths', 'team_indices', 'alive', '_free')
+
+    def __init__(self):
+        self.poses_x = array.array('f')
+        self.poses_y = array.array('f')
+        self.poses_angle = array.array('f')
+        self.healths = array.array('h')
+        self.team_indices = array.array('B')
+        self.alive = bytearray()
+        self._free = array.array('L')  # despawned handles, reused first
+
+    def __len__(self):
+        return len(self.alive) - len(self._free)
+
+    def __iter__(self):
+        yield from itertools.compress(range(len(self.alive)), self.alive)
+
+    def add(self, pose, health=0, team_index=0):
+        handle = len(self.alive)
+        x, y, angle = pose
+        self.poses_x.append(x)
+        self.poses_y.append(y)
+        self.poses_angle.append(angle)
+        self.healths.append(health)
+        self.team_indices.append(team_index)
+        self.alive.append(1)
+        return handle
+
+    def spawn(self, pose, health=0, team_index=0):
+        if not self._free:
+            return self.add(pose, health, team_index)
+        handle = self._free.pop()
+        self.set_pose(handle, pose)
+        self.healths[handle] = health
+        self.team_indices[handle] = team_index
+        self.alive[handle] = 1
+        return handle
+
+    def despawn(self, handle):
+        assert self.alive[handle], handle
+        self.alive[handle] = 0
+        self._free.append(handle)
+
+    def get_pose(self, handle):
+        return (self.poses_x[handle], self.poses_y[handle], self.poses_angle[handle])
+
+    def set_pose(self, handle, pose):
+        self.poses_x[handle], self.poses_y[handle], self.poses_angle[handle] = pose
 
 
 class Game(object):  # TODO
 
+    __slots__ = ('rules', 'gamemap', 'entities', 'players')
+
     instance = None
 
     def __init__(self, rules, gamemap):
         self.rules = rules
         self.gamemap = gamemap
-        self.entities = {}  # all
-        self.players = {}
+        self.entities = EntityTable()  # all
+        self.players = array.array('L')  # entity handles
+
+    def add_player(self, pose, health=100, team_index=0):
+        handle = self.entities.spawn(pose, health, team_index)
+        self.players.append(handle)
+        return handle
 
@@ -1,11 +1,16 @@
+import bisect
+import codecs
 import collections
+import functools
+import itertools
+import re
 import struct
+import weakref
 
 from PIL import Image, ImageDraw
 from pywolf.utils import (
-    stream_write, stream_pack, stream_unpack,
-    stream_pack_array, stream_unpack_array,
-    BinaryResource, ResourceManager
+    stream_read, stream_write, stream_unpack, stream_unpack_array, stream_unpack_bulk,
+    sequence_index, BinaryResource, ResourceManager
 )
 
 
@@ -47,104 +52,195 @@ CP437_CHARS = (
 )
 
 CP437_MAP = {c: i for i, c in enumerate(CP437_CHARS)}
+CP437_DECODING_TABLE = ''.join(CP437_CHARS)
+CP437_ENCODING_TABLE = codecs.charmap_build(CP437_DECODING_TABLE)
 
 
 def unicode_to_cp437(unicode_text):
-    cp437_bytes = bytes(CP437_MAP[c] for c in unicode_text)
+    cp437_bytes = codecs.charmap_encode(unicode_text, 'strict', CP437_ENCODING_TABLE)[0]
     return cp437_bytes
 
 
 def cp437_to_unicode(cp437_bytes):
-    unicode_text = ''.join(CP437_CHARS[c] for c in cp437_bytes)
+    unicode_text = codecs.charmap_decode(cp437_bytes, 'strict', CP437_DECODING_TABLE)[0]
     return unicode_text
 
 
+def text_codes(text):
+    if isinstance(text, str):
+        return map(ord, text)  # same as Font.__getitem__()
+    else:
+        return text
+
+
+TEXT_BREAK_CODES = frozenset(map(ord, '\n\v'))
+TEXT_BREAK_PATTERN = re.compile('[\n\v]')
+TEXT_BREAK_PATTERN_BYTES = re.compile(b'[\n\v]')
+
+
+def text_breaks(text):
+    if isinstance(text, str):
+        matches = TEXT_BREAK_PATTERN.finditer(text)
+    elif isinstance(text, (bytes, bytearray)):
+        matches = TEXT_BREAK_PATTERN_BYTES.finditer(text)
+    else:
+        return itertools.compress(itertools.count(), map(TEXT_BREAK_CODES.__contains__, text))
+    return (match.start() for match in matches)
+
+
 def text_measure(text, widths):
-    width = sum(widths[c] for c in text)
+    width = sum(map(widths.__getitem__, text_codes(text)))
     return width
 
 
 def text_wrap(text, max_width, widths):
+    offsets = list(itertools.accumulate(itertools.chain((0,), map(widths.__getitem__, text_codes(text)))))
     lines = []
-    start, endex = 0, 0
-    width = 0
-    for c in text:
-        delta = widths[c]
-        assert delta <= max_width
-        if width + delta <= max_width and c not in '\n\v':
-            width += delta
-            endex += 1
-        else:
+    start = 0
+    for endex in itertools.chain(text_breaks(text), (len(text),)):
+        if start == endex < len(text):
             lines.append(text[start:endex])
-            if c in '\n\v':
-                endex += 1
-                start = endex
-                width = 0
-            else:
-                start = endex
-                width = delta
+        while start < endex:  # longest prefix within max_width
+            stop = bisect.bisect_right(offsets, offsets[start] + max_width, start, endex + 1) - 1
+            assert start < stop, (start, max_width)
+            lines.append(text[start:stop])
+            start = stop
+        start = endex + 1
     return lines
 
 
 def pixels_transpose(pixels, size):
     width, height = size
-    yield from (pixels[x * width + y]
-                for y in range(height)
-                for x in range(width))
+    assert len(pixels) >= width * height  # trailing padding is ignored
+    transposed = bytearray(width * height)
+    for x in range(width):  # source is column-major
+        offset = x * height
+        transposed[x::width] = pixels[offset:(offset + height)]
+    return transposed
 
 
 def pixels_linearize(pixels, size):
     width, height = size
     assert width % 4 == 0
-    width_4 = width >> 2
-    area_4 = width_4 * height
-    yield from (pixels[(y * width_4 + (x >> 2)) + ((x & 3) * area_4)]
-                for y in range(height)
-                for x in range(width))
+    area_4 = (width >> 2) * height
+    assert len(pixels) >= area_4 * 4  # trailing padding is ignored
+    linear = bytearray(area_4 * 4)
+    for plane_index in range(4):  # VGA planes interleave by pixel column
+        offset = plane_index * area_4
+        linear[plane_index::4] = pixels[offset:(offset + area_4)]
+    return linear
 
 
-def sprite_expand(chunk, size, alpha_index=0xFF):
-    width, height = size
-    header = SpriteHeader.from_bytes(chunk)
-    expanded = bytearray([alpha_index]) * (width * height)
+SPRITE_BOUNDS_STRUCT = struct.Struct('<HH')
+SPRITE_ENDEX_STRUCT = struct.Struct('<H')
+SPRITE_POST_STRUCT = struct.Struct('<hH')
+
+
+@functools.lru_cache()
+def sprite_header_struct(width):
+    return struct.Struct('<HH{:d}H'.format(width))
 
-    unpack_from = struct.unpack_from
 
-    x = header.left
+@functools.lru_cache()
+def alpha_fill(alpha_index, area):
+    return bytes([alpha_index]) * area
+
+
+def sprite_expand(chunk, size, alpha_index=0xFF, linear=False, header=None, out=None):
+    """Expands into a new bytearray, or into the first width*height bytes of out.
+
+    With out, the returned memoryview aliases it: copy the pixels before reusing out.
+    """
+    width, height = size
+    if header is None:
+        header = SpriteHeader.from_bytes(chunk)
+    area = width * height
+    if out is None:
+        expanded = bytearray([alpha_index]) * area
+    else:  # caller-owned scratch, reused across calls
+        assert len(out) >= area
+        expanded = out
+        expanded[:area] = alpha_fill(alpha_index, area)
+
+    unpack_endex = SPRITE_ENDEX_STRUCT.unpack_from
+    unpack_post = SPRITE_POST_STRUCT.unpack_from
+
+    if linear:  # row-major, as pixels_transpose() would output
+        column_stride, y_stride = 1, width
+    else:  # column-major
+        column_stride, y_stride = height, 1
+
+    column_offset = header.left * column_stride
     for offset in header.offsets:
         assert 0 <= offset < len(chunk)
         while True:
-            y_endex = unpack_from('<H', chunk, offset)[0]
+            y_endex = unpack_endex(chunk, offset)[0]
             offset += 2
             if y_endex:
-                y_base, y_start = unpack_from('<hH', chunk, offset)
+                y_base, y_start = unpack_post(chunk, offset)
                 offset += 4
                 y_endex >>= 1
                 y_start >>= 1
-                for y in range(y_start, y_endex):
-                    expanded[x * width + y] = chunk[y_base + y]
+                post = chunk[(y_base + y_start):(y_base + y_endex)]
+                start = column_offset + y_start * y_stride
+                endex = column_offset + y_endex * y_stride
+                expanded[start:endex:y_stride] = post
             else:
                 break
-        x += 1
-    return bytes(expanded)
+        column_offset += column_stride
+
+    if out is not None:
+        return memoryview(expanded)[:area]
+    return expanded
 
 
 def rgbpalette_flatten(palette_colors):
-    flat_palette = []
-    for color in palette_colors:
-        assert len(color) == 3
-        flat_palette += color
+    assert all(len(color) == 3 for color in palette_colors)
+    flat_palette = list(itertools.chain.from_iterable(palette_colors))
     return flat_palette
 
 
 def rgbpalette_split(flat_palette):
     assert len(flat_palette) % 3 == 0
-    palette_colors = []
-    for i in range(0, len(flat_palette), 3):
-        palette_colors.append(list(flat_palette[i:(i + 3)]))
+    components = iter(flat_palette)
+    palette_colors = list(map(list, zip(components, components, components)))
     return palette_colors
 
 
+def rgbpalette_nearest(palette_colors, color):
+    r, g, b = color
+    nearest_index = 0
+    nearest_distance = 0x30000
+    for index, (pr, pg, pb) in enumerate(palette_colors):
+        dr = r - pr
+        dg = g - pg
+        db = b - pb
+        distance = dr * dr + dg * dg + db * db
+        if distance < nearest_distance:
+            nearest_distance = distance
+            nearest_index = index
+            if not distance:
+                break
+    return nearest_index
+
+
+def rgbpixels_to_indices(pixels_rgb, palette_colors, cache=None):
+    assert len(pixels_rgb) % 3 == 0
+    if cache is None:
+        cache = {}
+    pixels_rgb = bytes(pixels_rgb)
+    indices = bytearray(len(pixels_rgb) // 3)
+
+    for i in range(len(indices)):
+        color = pixels_rgb[(i * 3):(i * 3 + 3)]
+        index = cache.get(color)
+        if index is None:
+            index = rgbpalette_nearest(palette_colors, color)
+            cache[color] = index
+        indices[i] = index
+    return bytes(indices)
+
+
 def make_8bit_image(size, pixels, palette, alpha_index=None):
     image = Image.frombuffer('P', size, pixels, 'raw', 'P', 0, 1)
     image.putpalette(palette)
@@ -161,43 +257,48 @@ def jascpal_read(stream):
     line = stream.readline().strip()
     count = int(line)
     assert count > 0
-    palette = [None] * count
-    for i in range(count):
-        r, g, b = [int(x) for x in stream.readline().split()]
-        assert 0x00 <= r <= 0xFF
-        assert 0x00 <= g <= 0xFF
-        assert 0x00 <= b <= 0xFF
-        palette[i] = [r, g, b]
+    rows = [line.split() for line in stream.read().splitlines()[:count]]
+    assert len(rows) == count
+    assert all(len(row) == 3 for row in rows)
+    flat_palette = list(map(int, itertools.chain.from_iterable(rows)))
+    assert 0x00 <= min(flat_palette) and max(flat_palette) <= 0xFF
+    palette = rgbpalette_split(flat_palette)
     return palette
 
 
 def jascpal_write(stream, palette):
     assert palette
-    stream_write(stream, 'JASC-PAL\n')
-    stream_write(stream, '0100\n')
-    stream_write(stream, '{:d}\n'.format(len(palette)))
-    for r, g, b in palette:
-        assert 0x00 <= r <= 0xFF
-        assert 0x00 <= g <= 0xFF
-        assert 0x00 <= b <= 0xFF
-        stream_write(stream, '{:d} {:d} {:d}\n'.format(r, g, b))
+    flat_palette = rgbpalette_flatten(palette)  # also checks the triplets
+    assert 0x00 <= min(flat_palette) and max(flat_palette) <= 0xFF
+    lines = ['JASC-PAL\n', '0100\n', '{:d}\n'.format(len(palette))]
+    lines.extend(map('{:d} {:d} {:d}\n'.format, *zip(*palette)))
+    stream_write(stream, ''.join(lines))
+
+
+TARGA_HEADER_STRUCT = struct.Struct('<BBBHHBHHHHBB')
 
 
 def write_targa_bgrx(stream, size, depth_bits, pixels_bgrx):
-    stream_pack(stream, '<BBBHHBHHHHBB',
-                0,  #  id_length
-                0,  # colormap_type
-                2,  # image_type: BGR(A)
-                0,  # colormap_index
-                0,  # colormap_length
-                0,  # colormap_size
-                0,  # x_origin
-                0,  # y_origin
-                size[0],  # width
-                size[1],  # height
-                depth_bits,  # pixel_size: 24 (BGR) | 32 (BGRA)
-                0x00)  # attributes
-    stream_write(stream, pixels_bgrx)
+    assert depth_bits in (24, 32)
+    try:
+        pixels_view = memoryview(pixels_bgrx).cast('B')
+    except TypeError:  # plain sequence of byte values
+        pixels_view = memoryview(bytes(pixels_bgrx))
+    assert len(pixels_view) == size[0] * size[1] * (depth_bits >> 3)
+    header = TARGA_HEADER_STRUCT.pack(0,  #  id_length
+                                      0,  # colormap_type
+                                      2,  # image_type: BGR(A)
+                                      0,  # colormap_index
+                                      0,  # colormap_length
+                                      0,  # colormap_size
+                                      0,  # x_origin
+                                      0,  # y_origin
+                                      size[0],  # width
+                                      size[1],  # height
+                                      depth_bits,  # pixel_size: 24 (BGR) | 32 (BGRA)
+                                      0x00)  # attributes
+    stream_write(stream, header)
+    stream_write(stream, pixels_view)
 
 
 def build_color_image(size, color):
@@ -237,34 +338,47 @@ WINFNT_HEADER_FMT = (
     ('dfReserved', '<B'),
 )
 
+WINFNT_HEADER_STRUCT = struct.Struct('<' + ''.join(fmt[1:] for _, fmt in WINFNT_HEADER_FMT))
+
 BYTE_MASK_EXPANDED = tuple(bytes([1 if m & (1 << (7 - b)) else 0 for b in range(8)]) for m in range(256))
 BYTE_MASK_TO_BYTES = tuple(bytes([0xFF if m & (1 << (7 - b)) else 0x00 for b in range(8)]) for m in range(256))
+BYTE_BIT_LUTS = tuple(bytes([1 if m & (1 << (7 - b)) else 0 for m in range(256)]) for b in range(8))
+
+
+def bitmap_expand(bitmap):
+    bitmap = bytes(bitmap)
+    expanded = bytearray(len(bitmap) << 3)
+    for bit in range(8):  # BYTE_MASK_EXPANDED items, one bit position at a time
+        expanded[bit::8] = bitmap.translate(BYTE_BIT_LUTS[bit])
+    return bytes(expanded)
 
 
 def winfnt_read(stream):
     start = stream.tell()
-    fields = collections.OrderedDict((name, stream_unpack(fmt, stream)[0])
-                                     for name, fmt in WINFNT_HEADER_FMT)
-    fields['dfCopyright'] = fields['dfCopyright'].rstrip(b'\0')
+    values = WINFNT_HEADER_STRUCT.unpack(stream_read(stream, WINFNT_HEADER_STRUCT.size))
+    fields = collections.OrderedDict(zip((name for name, _ in WINFNT_HEADER_FMT), values))
+    fields['dfCopyright'] = fields['dfCopyright'].partition(b'\0')[0]
     count = fields['dfLastChar'] - fields['dfFirstChar'] + 2
-    fields['dfCharTable'] = [stream_unpack('<HH', stream) for _ in range(count)]
+    fields['dfCharTable'] = list(stream_unpack_array('<HH', stream, count, scalar=False))
     height = fields['dfPixHeight']
 
-    palette = (0x00, 0x00, 0x00, 0xFF, 0xFF, 0xFF)
+    palette = bytes((0x00, 0x00, 0x00, 0xFF, 0xFF, 0xFF))
     images = []
+    bitmaps = []
 
     for width, offset in fields['dfCharTable']:
         stream.seek(start + offset)
-        lines = [[] for y in range(height)]
-        padded_width = (width + 7) & 0xFFF8
-
-        for _ in range(padded_width >> 3):
-            for y in range(height):
-                mask = stream.read(1)
-                lines[y].append(mask)
+        columns = ((width + 7) & 0xFFF8) >> 3
+        bitmap = stream_read(stream, columns * height)  # column-major
+        bitmaps.append(pixels_transpose(bitmap, (columns, height)))
 
-        bitmap = b''.join(b''.join(line) for line in lines)
-        pixels = b''.join(BYTE_MASK_EXPANDED[mask] for mask in bitmap)
+    pixels_flat = bitmap_expand(b''.join(bitmaps))  # all glyphs at once
+    pixels_offset = 0
+    for (width, _), bitmap in zip(fields['dfCharTable'], bitmaps):
+        padded_width = (width + 7) & 0xFFF8
+        pixels_size = len(bitmap) << 3
+        pixels = pixels_flat[pixels_offset:(pixels_offset + pixels_size)]
+        pixels_offset += pixels_size
         image = make_8bit_image((padded_width, height), pixels, palette)
         image = image.crop((0, 0, width, height))
         images.append(image)
@@ -293,9 +407,36 @@ ANSI_PALETTE = (
 )
 
 
-def render_ansi_line(ansi_image, cursor, font, text, attrs, special=None, font_size=None):
+FONT_BLOCK_SIZES = weakref.WeakKeyDictionary()
+
+
+def font_block_size(font):
+    try:
+        return FONT_BLOCK_SIZES[font]
+    except KeyError:
+        size = font.getsize('\u2588')  # full block
+        FONT_BLOCK_SIZES[font] = size
+        return size
+
+
+def ansi_glyph_overhangs(font, font_size, char, tiles):
+    # Glyphs inking outside their cell cannot be pasted as clipped tiles
+    key = ('overhang', char)
+    overhangs = tiles.get(key)
+    if overhangs is None:
+        font_width, font_height = font_size
+        canvas = Image.new('P', (font_width * 3, font_height * 3), color=0)
+        ImageDraw.Draw(canvas).text((font_width, font_height), char, font=font, fill=1)
+        bbox = canvas.getbbox()
+        overhangs = bbox is not None and not (font_width <= bbox[0] and font_height <= bbox[1] and
+                                              bbox[2] <= font_width * 2 and bbox[3] <= font_height * 2)
+        tiles[key] = overhangs
+    return overhangs
+
+
+def render_ansi_line(ansi_image, cursor, font, text, attrs, special=None, font_size=None, tiles=None):
     if font_size is None:
-        font_size = font.getsize('\u2588')  # full block
+        font_size = font_block_size(font)
     font_width, font_height = font_size
     image_width, image_height = ansi_image.size
     text_width = image_width // font_width
@@ -303,27 +444,93 @@ def render_ansi_line(ansi_image, cursor, font, text, attrs, special=None, font_s
     cursor_x, cursor_y = cursor
     left = cursor[0] * font_width
     top = cursor[1] * font_height
-    bg_mask = 0x0F if special is 'fullcolor' else 0x07
-    draw = ImageDraw.Draw(ansi_image)
+    bg_mask = 0x0F if special == 'fullcolor' else 0x07
+    hide = special == 'hide'
+    if tiles is None:
+        tiles = {}  # ('image', char, fg, bg) -> cell image, shareable across calls with the same font
+    paste = ansi_image.paste
+    redraws = []  # row cells from the first overhanging glyph on, drawn in order like the uncached text
 
     for char, attr in zip(text, attrs):
         bg = (attr >> 4) & bg_mask
-
-        box = (left, top, left + font_width - 1, top + font_height - 1)
-        draw.rectangle(box, fill=bg)
-
-        fg = bg if special is 'hide' and attr & 0x80 else attr & 0x0F
-        draw.text((left, top), char, font=font, fill=fg)
+        fg = bg if hide and attr & 0x80 else attr & 0x0F
+
+        key = ('image', char, fg, bg)
+        tile = tiles.get(key)
+        if tile is None:
+            tile = Image.new('P', font_size, color=bg)
+            ImageDraw.Draw(tile).text((0, 0), char, font=font, fill=fg)
+            tiles[key] = tile
+        paste(tile, (left, top))
+
+        overhangs = tiles.get(('overhang', char))
+        if overhangs is None:
+            overhangs = ansi_glyph_overhangs(font, font_size, char, tiles)
+        if redraws or overhangs:
+            redraws.append(((left, top), char, fg))
 
         left += font_width
         cursor_x += 1
         if cursor_x >= text_width:
+            ansi_redraw_glyphs(ansi_image, font, redraws)
             cursor_x = 0
             cursor_y += 1
             left = 0
             top += font_height
         if cursor_y >= text_height:
             break
+    ansi_redraw_glyphs(ansi_image, font, redraws)
+
+
+def ansi_redraw_glyphs(ansi_image, font, redraws):
+    if redraws:
+        draw = ImageDraw.Draw(ansi_image)
+        for position, char, fg in redraws:
+            draw.text(position, char, font=font, fill=fg)
+        del redraws[:]
+
+
+def render_ansi_screen(text_size, font, text, attrs, special=None, font_size=None, tiles=None,
+                       palette=ANSI_PALETTE):
+    if font_size is None:
+        font_size = font_block_size(font)
+    font_width, font_height = font_size
+    text_width, text_height = text_size
+    bg_mask = 0x0F if special == 'fullcolor' else 0x07
+    hide = special == 'hide'
+    if tiles is None:
+        tiles = {}  # ('rows', char, fg, bg) -> cell pixel rows, shareable across calls with the same font
+
+    cells_count = text_width * text_height
+    cells = [(bytes(font_width),) * font_height] * cells_count
+    for index, (char, attr) in enumerate(zip(text[:cells_count], attrs)):
+        overhangs = tiles.get(('overhang', char))
+        if overhangs is None:
+            overhangs = ansi_glyph_overhangs(font, font_size, char, tiles)
+        if overhangs:  # clipped rows would differ, paste and redraw instead
+            ansi_image = create_ansi_image(text_size, font_size, palette=palette)
+            render_ansi_line(ansi_image, (0, 0), font, text, attrs, special, font_size, tiles)
+            return ansi_image
+
+        bg = (attr >> 4) & bg_mask
+        fg = bg if hide and attr & 0x80 else attr & 0x0F
+
+        key = ('rows', char, fg, bg)
+        rows = tiles.get(key)
+        if rows is None:
+            tile = Image.new('P', font_size, color=bg)
+            ImageDraw.Draw(tile).text((0, 0), char, font=font, fill=fg)
+            data = tile.tobytes()
+            rows = tuple(data[(y * font_width):((y + 1) * font_width)] for y in range(font_height))
+            tiles[key] = rows
+        cells[index] = rows
+
+    # Whole pixel lines are joined from the cell rows, then wrapped as a single image
+    lines = []
+    for offset in range(0, cells_count, text_width):
+        lines.extend(map(b''.join, zip(*cells[offset:(offset + text_width)])))
+    size = (text_width * font_width, text_height * font_height)
+    return make_8bit_image(size, b''.join(lines), palette)
 
 
 def create_ansi_image(text_size, font_size, color=0, palette=ANSI_PALETTE):
@@ -354,7 +561,7 @@ class PictureManager(ResourceManager):
         start = self._start
 
         size = chunks_handler.pics_size[index]
-        pixels = bytes(pixels_linearize(chunk, size))
+        pixels = pixels_linearize(chunk, size)
         palette = palette_map.get((start + index), palette_map[...])
         return Picture(size, pixels, palette)
 
@@ -378,7 +585,7 @@ class Tile8Manager(ResourceManager):
         area = size[0] * size[1]
         offset = index * area
         chunk = chunk[offset:(offset + area)]
-        pixels = bytes(pixels_linearize(chunk, size))
+        pixels = pixels_linearize(chunk, size)
         palette = palette_map.get(start, palette_map[...])
         return Picture(size, pixels, palette)
 
@@ -404,7 +611,7 @@ class TextureManager(ResourceManager):
         palette = self._palette
         size = self._size
 
-        pixels = bytes(pixels_transpose(chunk, size))
+        pixels = pixels_transpose(chunk, size)
         return Texture(size, pixels, palette)
 
 
@@ -419,12 +626,22 @@ class SpriteHeader(BinaryResource):
     def from_stream(cls, chunk_stream):
         left, right = stream_unpack('<HH', chunk_stream)
         width = right - left + 1
-        offsets = list(stream_unpack_array('<H', chunk_stream, width))
+        offsets = list(stream_unpack_bulk('<H', chunk_stream, width))
         return cls(left, right, offsets)
 
     def to_stream(self, stream):
-        stream_pack(stream, '<HH', self.left, self.right)
-        stream_pack_array(stream, '<H', self.offsets)
+        stream_write(stream, self.to_bytes())
+
+    def to_bytes(self):
+        offsets = self.offsets
+        return sprite_header_struct(len(offsets)).pack(self.left, self.right, *offsets)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        left, right = SPRITE_BOUNDS_STRUCT.unpack_from(data, offset)
+        width = right - left + 1
+        offsets = list(sprite_header_struct(width).unpack_from(data, offset)[2:])
+        return cls(left, right, offsets)
 
 
 class Sprite(object):
@@ -451,14 +668,14 @@ class SpriteManager(ResourceManager):
         size = self._size
         alpha_index = self._alpha_index
 
-        pixels = sprite_expand(chunk, size, alpha_index)
-        pixels = bytes(pixels_transpose(pixels, size))
+        pixels = sprite_expand(chunk, size, alpha_index, linear=True)
         return Sprite(size, pixels, palette, alpha_index)
 
 
 class FontHeader(BinaryResource):
 
     CHARACTER_COUNT = 256
+    STRUCT = struct.Struct('<H{0:d}H{0:d}B'.format(CHARACTER_COUNT))
 
     def __init__(self, height, offsets, widths):
         assert 0 < height
@@ -471,29 +688,54 @@ class FontHeader(BinaryResource):
 
     @classmethod
     def from_stream(cls, chunk_stream):
-        height = stream_unpack('<H', chunk_stream)[0]
-        offsets = list(stream_unpack_array('<H', chunk_stream, cls.CHARACTER_COUNT))
-        widths = list(stream_unpack_array('<B', chunk_stream, cls.CHARACTER_COUNT))
-        return cls(height, offsets, widths)
+        return cls.from_bytes(stream_read(chunk_stream, cls.STRUCT.size))
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        fields = cls.STRUCT.unpack_from(data, offset)
+        count = cls.CHARACTER_COUNT
+        offsets = list(fields[1:(1 + count)])
+        widths = list(fields[(1 + count):])
+        return cls(fields[0], offsets, widths)
 
     def to_stream(self, chunk_stream):
-        stream_pack(chunk_stream, '<H', self.height)
-        stream_pack_array(chunk_stream, '<H', self.locations)
-        stream_pack_array(chunk_stream, '<B', self.widths)
+        stream_write(chunk_stream, self.to_bytes())
+
+    def to_bytes(self):
+        return type(self).STRUCT.pack(self.height, *self.offsets, *self.widths)
 
 
 class Font(object):
 
     def __init__(self, height, widths, glyphs_pixels, palette, alpha_index=0xFF):
         count = len(glyphs_pixels)
-        images = [None] * count
-        for i in range(count):
-            if widths[i]:
-                images[i] = make_8bit_image((widths[i], height), glyphs_pixels[i], palette)
+
+        # All the glyphs side by side; single glyph images are cropped on demand
+        atlas_offsets = [0]
+        atlas_offsets.extend(itertools.accumulate(widths[:count]))
+        atlas_width = atlas_offsets[-1]
+        if atlas_width:
+            atlas_pixels = bytearray(atlas_width * height)
+            for i in range(count):
+                width = widths[i]
+                if width:
+                    glyph_pixels = glyphs_pixels[i]
+                    offset = atlas_offsets[i]
+                    for y in range(height):
+                        atlas_pixels[offset:(offset + width)] = glyph_pixels[(y * width):((y + 1) * width)]
+                        offset += atlas_width
+            atlas = make_8bit_image((atlas_width, height), atlas_pixels, bytes(palette))
+        else:
+            atlas = None
 
         self.height = height
         self.widths = widths
-        self.images = images
+        self.palette = bytes(palette)
+        self.width_table = bytes(widths) if len(widths) == 256 and max(widths) < 256 else None
+        self.alpha_index = alpha_index
+        self.atlas = atlas
+        self.atlas_offsets = atlas_offsets
+        self._images = [None] * count
 
     def __len__(self):
         return len(self.widths)
@@ -501,13 +743,42 @@ class Font(object):
     def __getitem__(self, key):
         if isinstance(key, str):
             key = ord(key)
-        return self.images[key]
+        key = sequence_index(key, len(self._images))
+        image = self._images[key]
+        if image is None and self.widths[key]:
+            image = self.atlas.crop(self.atlas_box(key))
+            self._images[key] = image
+        return image
+
+    @property
+    def images(self):
+        return [self[i] for i in range(len(self._images))]
+
+    def atlas_box(self, key):
+        if isinstance(key, str):
+            key = ord(key)
+        left = self.atlas_offsets[key]
+        return (left, 0, left + self.widths[key], self.height)
 
     def __call__(self, text_bytes):
-        get_image = self.images.__getitem__
-        yield from (get_image(ord(c)) for c in text_bytes)
+        get_image = self.__getitem__
+        yield from map(get_image, text_codes(text_bytes))
+
+    def render_text(self, text_bytes):
+        codes = list(text_codes(text_bytes))
+        width = text_measure(codes, self.widths)
+        image = Image.new('P', (width, self.height), self.alpha_index)
+        image.putpalette(self.palette)
+        x = 0
+        for glyph_image in map(self.__getitem__, codes):
+            if glyph_image is not None:
+                image.paste(glyph_image, (x, 0))
+                x += glyph_image.width
+        return image
 
     def measure(self, text):
+        if self.width_table is not None and isinstance(text, (bytes, bytearray)):
+            return sum(text.translate(self.width_table))
         return text_measure(text, self.widths)
 
     def wrap(self, text, max_width):
@@ -541,21 +812,29 @@ class FontManager(ResourceManager):
 
 class DOSScreen(object):
 
-    def __init__(self, data, font, text_size, font_size=None):
+    def __init__(self, data, font, text_size, font_size=None, tiles=None):
         assert len(data) % 2 == 0
-        self.chars = bytes(data[i] for i in range(9 + 0, len(data), 2))
-        self.attrs = bytes(data[i] for i in range(9 + 1, len(data), 2))
+        self.chars = bytes(data[(9 + 0)::2])
+        self.attrs = bytes(data[(9 + 1)::2])
 
         if font_size is None:
-            font_size = font.getsize('\u2588')  # full block
-        frame0 = create_ansi_image(text_size, font_size)
+            font_size = font_block_size(font)
+        if tiles is None:
+            tiles = {}
         text = cp437_to_unicode(self.chars)
-        render_ansi_line(frame0, (0, 0), font, text, self.attrs, font_size=font_size)
-
-        if any(attr & 0x80 for attr in self.attrs):
-            frame1 = create_ansi_image(text_size, font_size)
-            text = cp437_to_unicode(self.chars)
-            render_ansi_line(frame1, (0, 0), font, text, self.attrs, font_size=font_size, special='hide')
+        frame0 = render_ansi_screen(text_size, font, text, self.attrs, font_size=font_size, tiles=tiles)
+
+        if max(self.attrs, default=0) & 0x80:  # any blinking
+            # Only the blinking cells differ from the first frame
+            frame1 = frame0.copy()
+            start = 0
+            for blinking, run in itertools.groupby(self.attrs, key=(0x80).__and__):
+                endex = start + sum(1 for _ in run)
+                if blinking:
+                    cursor = tuple(reversed(divmod(start, text_size[0])))
+                    render_ansi_line(frame1, cursor, font, text[start:endex], self.attrs[start:endex],
+                                     font_size=font_size, special='hide', tiles=tiles)
+                start = endex
             self.frames = [frame0, frame1]
         else:
             self.frames = [frame0]
@@ -571,9 +850,12 @@ class DOSScreenManager(ResourceManager):
         self._font = font
         self._size = size
         self._font_size = font_size
+        self._tiles = {}  # rendered cells, shared by all the screens
 
     def _load_resource(self, index, chunk):
-        return DOSScreen(chunk, self._font, self._size, self._font_size)
+        if self._font_size is None:  # resolved once for all the screens
+            self._font_size = font_block_size(self._font)
+        return DOSScreen(chunk, self._font, self._size, self._font_size, self._tiles)
 
 
 class TextArtManager(ResourceManager):
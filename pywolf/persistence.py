@@ -1,8 +1,26 @@
+import array
 import io
+import itertools
+import operator
+import zlib
 
-from pywolf.compression import HUFFMAN_NODE_COUNT, huffman_expand, carmack_expand, rlew_expand
+from pywolf.compression import HUFFMAN_NODE_COUNT, huffman_build_branches, huffman_build_table, huffman_expand, carmack_expand, rlew_expand, rlew_tag_bytes
 from pywolf.game import TileMapHeader
-from pywolf.utils import stream_fit, stream_read, stream_unpack, stream_unpack_array, sequence_index, sequence_getitem
+from pywolf.utils import stream_fit, stream_read, stream_readinto, stream_unpack, stream_unpack_array, stream_unpack_bulk, sequence_index, sequence_getitem
+
+
+def chunk_offsets_backfill(chunk_offsets, missing=None):
+    # Each missing offset takes the next valid one, so its chunk is empty
+    chunk_offsets.reverse()
+    chunk_offsets[:] = itertools.accumulate(chunk_offsets,
+                                            lambda following, offset: following if offset == missing else offset)
+    chunk_offsets.reverse()
+    return chunk_offsets
+
+
+def chunk_offsets_check(chunk_offsets, start, end):
+    return (start <= chunk_offsets[0] and chunk_offsets[-1] <= end and
+            all(map(operator.le, chunk_offsets, itertools.islice(chunk_offsets, 1, None))))
 
 
 class ChunksHandler(object):
@@ -11,7 +29,11 @@ class ChunksHandler(object):
         self.clear()
 
     def clear(self):
+        data_view = getattr(self, '_data_view', None)
+        if data_view is not None:
+            data_view.release()  # let the mapping be closed
         self._data_stream = None
+        self._data_view = None
         self._data_base = None
         self._data_size = None
         self._chunk_count = 0
@@ -39,10 +61,26 @@ class ChunksHandler(object):
     def load(self, data_stream, data_base=None, data_size=None):
         self.clear()
         data_base, data_size = stream_fit(data_stream, data_base, data_size)
+        try:
+            data_view = memoryview(data_stream)  # e.g. mmap.mmap
+        except TypeError:
+            data_view = None
         self._data_stream = data_stream
+        self._data_view = data_view
         self._data_base = data_base
         self._data_size = data_size
 
+    def _read_span(self, offset, size):
+        data_view = self._data_view
+        if data_view is not None:
+            start = self._data_base + offset
+            return data_view[start:(start + size)]
+        else:
+            span = bytearray(size)
+            self._seek(0, (offset,))
+            stream_readinto(self._data_stream, span)
+            return span
+
     def extract_chunk(self, index):
         raise NotImplementedError
 
@@ -89,7 +127,7 @@ class PrecachedChunksHandler(ChunksHandler):
         return self._cache[index]
 
     def __len__(self):
-        return len(self._wrapped)
+        return len(self._cache)  # still valid after the wrapped handler is cleared
 
     def __getitem__(self, key):
         return self._cache[key]
@@ -110,6 +148,52 @@ class PrecachedChunksHandler(ChunksHandler):
         self._cache.extend(self._wrapped)
 
 
+class CompressedChunksCache(object):
+
+    def __init__(self, threshold=1024, level=1):
+        assert 0 <= threshold
+        assert 0 <= level <= 9
+        self._threshold = threshold
+        self._level = level
+        self._chunks = []
+        self._compressed = bytearray()  # flags, one per chunk
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[index] for index in range(*key.indices(len(self)))]
+        chunk = self._chunks[key]
+        if self._compressed[key]:
+            chunk = zlib.decompress(chunk)
+        return chunk
+
+    def __iter__(self):
+        yield from (self[index] for index in range(len(self)))
+
+    def clear(self):
+        self._chunks.clear()
+        self._compressed.clear()
+
+    def append(self, chunk):
+        if len(chunk) > self._threshold:
+            packed = zlib.compress(chunk, self._level)
+            if len(packed) < len(chunk):
+                self._chunks.append(packed)
+                self._compressed.append(True)
+                return
+        self._chunks.append(chunk)
+        self._compressed.append(False)
+
+    def extend(self, chunks):
+        for chunk in chunks:
+            self.append(chunk)
+
+    def stored_size(self):
+        return sum(map(len, self._chunks))
+
+
 class VSwapChunksHandler(ChunksHandler):
 
     def clear(self):
@@ -130,20 +214,17 @@ class VSwapChunksHandler(ChunksHandler):
         assert 0x00 <= alpha_index <= 0xFF
 
         chunk_count, sprites_start, sounds_start = stream_unpack('<HHH', data_stream)
-        chunk_offsets = list(stream_unpack_array('<L', data_stream, chunk_count))
+        chunk_offsets = list(stream_unpack_bulk('<L', data_stream, chunk_count))
         chunk_offsets.append(data_size)
 
         pages_offset = chunk_offsets[0]
         pages_size = data_size - pages_offset
         assert data_size_guard is None or data_size < data_size_guard
-        for i in reversed(range(chunk_count)):
-            if not chunk_offsets[i]:
-                chunk_offsets[i] = chunk_offsets[i + 1]
-        assert all(pages_offset <= chunk_offsets[i] <= data_size for i in range(chunk_count))
-        assert all(chunk_offsets[i] <= chunk_offsets[i + 1] for i in range(chunk_count))
+        chunk_offsets_backfill(chunk_offsets, 0)
+        assert chunk_offsets_check(chunk_offsets, pages_offset, data_size)
 
         self._chunk_count = chunk_count
-        self._chunk_offsets = chunk_offsets
+        self._chunk_offsets = array.array('L', chunk_offsets)
         self._pages_offset = pages_offset
         self._pages_size = pages_size
         self._image_size = image_size
@@ -215,13 +296,12 @@ class AudioChunksHandler(ChunksHandler):
         assert header_size % 4 == 0
 
         chunk_count = header_size // 4
-        chunk_offsets = list(stream_unpack_array('<L', header_stream, chunk_count))
+        chunk_offsets = list(stream_unpack_bulk('<L', header_stream, chunk_count))
         chunk_offsets.append(data_size)
-        assert all(0 <= chunk_offsets[i] <= data_size for i in range(chunk_count))
-        assert all(chunk_offsets[i] <= chunk_offsets[i + 1] for i in range(chunk_count))
+        assert chunk_offsets_check(chunk_offsets, 0, data_size)
 
         self._chunk_count = chunk_count
-        self._chunk_offsets = chunk_offsets
+        self._chunk_offsets = array.array('L', chunk_offsets)
         self._header_stream = header_stream
         self._header_base = header_base
         self._header_size = header_size
@@ -249,6 +329,7 @@ class GraphicsChunksHandler(ChunksHandler):
         self._partition_map = {}
         self._pics_size_index = None
         self._huffman_nodes = ()
+        self._huffman_table = None
         self.pics_size = ()
 
     def _seek(self, index, offsets=None):
@@ -279,15 +360,12 @@ class GraphicsChunksHandler(ChunksHandler):
             if offset < 0xFFFFFF:
                 chunk_offsets[i] = offset
         chunk_offsets.append(data_size)
-        for i in reversed(range(chunk_count)):
-            if chunk_offsets[i] is None:
-                chunk_offsets[i] = chunk_offsets[i + 1]
-        assert all(0 <= chunk_offsets[i] <= data_size for i in range(chunk_count))
-        assert all(chunk_offsets[i] <= chunk_offsets[i + 1] for i in range(chunk_count))
+        chunk_offsets_backfill(chunk_offsets)
+        assert chunk_offsets_check(chunk_offsets, 0, data_size)
 
         huffman_nodes = list(stream_unpack_array('<HH', huffman_stream, HUFFMAN_NODE_COUNT, scalar=False))
         self._chunk_count = chunk_count
-        self._chunk_offsets = chunk_offsets
+        self._chunk_offsets = array.array('L', chunk_offsets)
         self._header_stream = header_stream
         self._header_base = header_base
         self._header_size = header_size
@@ -297,6 +375,7 @@ class GraphicsChunksHandler(ChunksHandler):
         self._partition_map = partition_map
         self._pics_size_index = pics_size_index
         self._huffman_nodes = huffman_nodes
+        self._huffman_table = huffman_build_table(huffman_build_branches(huffman_nodes))
         self.pics_size = self._build_pics_size()
         return self
 
@@ -304,6 +383,7 @@ class GraphicsChunksHandler(ChunksHandler):
         chunk_count = self._chunk_count
         data_stream = self._data_stream
         huffman_nodes = self._huffman_nodes
+        huffman_table = self._huffman_table
         index = sequence_index(index, chunk_count)
 
         chunk = b''
@@ -312,7 +392,7 @@ class GraphicsChunksHandler(ChunksHandler):
             self._seek(index)
             compressed_size, expanded_size = self._read_sizes(index)
             chunk = stream_read(data_stream, compressed_size)
-            chunk = huffman_expand(chunk, expanded_size, huffman_nodes)
+            chunk = huffman_expand(chunk, expanded_size, huffman_nodes, table=huffman_table)
         return chunk
 
     def _read_sizes(self, index):
@@ -371,6 +451,8 @@ class MapChunksHandler(ChunksHandler):
         self._header_size = None
         self._carmacized = True
         self._rlew_tag = None
+        self._rlew_tag_bytes = None
+        self._headers = {}
         self.planes_count = 0
 
     def load(self, data_stream, header_stream,
@@ -389,47 +471,58 @@ class MapChunksHandler(ChunksHandler):
 
         assert (header_size - 2) % 4 == 0
         chunk_count = (header_size - 2) // 4
-        chunk_offsets = [None] * chunk_count
-        for i in range(chunk_count):
-            offset = stream_unpack('<L', header_stream)[0]
-            if 0 < offset < 0xFFFFFFFF:
-                chunk_offsets[i] = offset
+        chunk_offsets = [offset if 0 < offset < 0xFFFFFFFF else None
+                         for offset in stream_unpack_bulk('<L', header_stream, chunk_count)]
         chunk_offsets.append(data_size)
-        for i in reversed(range(chunk_count)):
-            if chunk_offsets[i] is None:
-                chunk_offsets[i] = chunk_offsets[i + 1]
-        assert all(0 < chunk_offsets[i] <= data_size for i in range(chunk_count))
-        assert all(chunk_offsets[i] <= chunk_offsets[i + 1] for i in range(chunk_count))
+        chunk_offsets_backfill(chunk_offsets)
+        assert chunk_offsets_check(chunk_offsets, 1, data_size)
 
         self._chunk_count = chunk_count
-        self._chunk_offsets = chunk_offsets
+        self._chunk_offsets = array.array('L', chunk_offsets)
         self._header_stream = header_stream
         self._header_base = header_base
         self._header_size = header_size
         self._carmacized = carmacized
         self._rlew_tag = rlew_tag
+        self._rlew_tag_bytes = rlew_tag_bytes(rlew_tag)
+        self._headers = {}
         self.planes_count = planes_count
         return self
 
+    def extract_header(self, index):
+        index = sequence_index(index, len(self))
+        headers = self._headers
+        try:
+            return headers[index]
+        except KeyError:
+            header = None
+            if self.sizeof(index):
+                self._seek(index)
+                header = TileMapHeader.from_stream(self._data_stream, self.planes_count)
+            headers[index] = header
+            return header
+
     def extract_chunk(self, index):
-        data_stream = self._data_stream
         carmacized = self._carmacized
         rlew_tag = self._rlew_tag
+        rlew_tag_bytes = self._rlew_tag_bytes
         planes_count = self.planes_count
 
-        header = None
         planes = [None] * planes_count
-        chunk_size = self.sizeof(index)
-        if chunk_size:
-            self._seek(index)
-            header = TileMapHeader.from_stream(data_stream, planes_count)
+        header = self.extract_header(index)
+        if header is not None:
+            plane_offsets = header.plane_offsets
+            plane_sizes = header.plane_sizes
+
+            span_start = min(plane_offsets)
+            span_end = max(plane_offsets[i] + plane_sizes[i] for i in range(planes_count))
+            span_view = memoryview(self._read_span(span_start, span_end - span_start))
 
             for i in range(planes_count):
-                self._seek(i, header.plane_offsets)
-                expanded_size = stream_unpack('<H', data_stream)[0]
-                compressed_size = header.plane_sizes[i] - 2
-                chunk = stream_read(data_stream, compressed_size)
+                start = plane_offsets[i] - span_start
+                expanded_size = span_view[start] | (span_view[start + 1] << 8)
+                chunk = span_view[(start + 2):(start + plane_sizes[i])]
                 if carmacized:
                     chunk = carmack_expand(chunk, expanded_size)[2:]
-                planes[i] = rlew_expand(chunk, rlew_tag)
+                planes[i] = rlew_expand(chunk, rlew_tag, tag_bytes=rlew_tag_bytes)
         return (header, planes)
@@ -96,6 +96,20 @@ def stream_read(stream, size):
     return b''.join(chunks)
 
 
+def stream_readinto(stream, buffer):
+    buffer_view = memoryview(buffer).cast('B')
+    size = len(buffer_view)
+    done = 0
+    while done < size:
+        count = stream.readinto(buffer_view[done:])
+        if count:
+            done += count
+        else:
+            fmt = 'EOF at stream {!s} offset 0x{:X}'.format
+            raise IOError(fmt(stream, stream.tell()))
+    return done
+
+
 def stream_write(stream, raw):
     written = 0
     if isinstance(raw, str):
@@ -112,12 +126,12 @@ def stream_pack(stream, fmt, *args):
 
 
 def stream_pack_array(stream, fmt, values, scalar=True):
+    item_struct = struct.Struct(fmt)
     if scalar:
-        for value in values:
-            return stream_write(stream, struct.pack(fmt, value))
+        chunk = b''.join(map(item_struct.pack, values))
     else:
-        for entry in values:
-            return stream_write(stream, struct.pack(fmt, *entry))
+        chunk = b''.join(item_struct.pack(*entry) for entry in values)
+    return stream_write(stream, chunk)
 
 
 def stream_unpack(fmt, stream):
@@ -125,11 +139,23 @@ def stream_unpack(fmt, stream):
     return struct.unpack(fmt, chunk)
 
 
+def stream_unpack_bulk(fmt, stream, count):
+    if fmt[:1] in '@=<>!':
+        byte_order, body = fmt[:1], fmt[1:]
+    else:
+        byte_order, body = '', fmt
+    bulk_struct = struct.Struct(byte_order + body * count)  # whole item body, count times
+    assert bulk_struct.size == struct.calcsize(fmt) * count
+    return bulk_struct.unpack(stream_read(stream, bulk_struct.size))
+
+
 def stream_unpack_array(fmt, stream, count, scalar=True):
     if scalar:
-        yield from (stream_unpack(fmt, stream)[0] for _ in range(count))
+        yield from stream_unpack_bulk(fmt, stream, count)
     else:
-        yield from (stream_unpack(fmt, stream) for _ in range(count))
+        item_struct = struct.Struct(fmt)
+        chunk = stream_read(stream, item_struct.size * count)
+        yield from item_struct.iter_unpack(chunk)
 
 
 def sequence_index(index, length):
@@ -159,6 +185,8 @@ def sequence_getitem(key, length, getter):
 
 class BinaryResource(object):
 
+    __slots__ = ()
+
     @classmethod
     def from_stream(cls, stream, *args, **kwargs):
         raise NotImplementedError
@@ -66,6 +66,19 @@ class Test(unittest.TestCase):
 
         self.assertEqual(expanded, data)
 
+        branches = pywolf.compression.huffman_build_branches(nodes)
+        expanded = pywolf.compression.huffman_expand(compressed, len(data), nodes, branches)
+        self.assertEqual(expanded, data)
+
+        table = pywolf.compression.huffman_build_table(branches)
+        expanded = pywolf.compression.huffman_expand(compressed, len(data), nodes, table=table)
+        self.assertEqual(expanded, data)
+
+        node_lists = [list(node) for node in nodes]  # unhashable nodes, as read from a dictionary file
+        for size in (1, 40, 41):  # small chunks reuse the memoized branches
+            self.assertEqual(pywolf.compression.huffman_expand(compressed, size, nodes), data[:size])
+            self.assertEqual(pywolf.compression.huffman_expand(compressed, size, node_lists), data[:size])
+
     def testRLEW(self):
         logger = logging.getLogger()
         logger.info('testRLEW')
@@ -85,6 +98,8 @@ class Test(unittest.TestCase):
         export(r'{}/rlew_expanded.bin'.format(self.OUTPUT_FOLDER), expanded)
 
         self.assertEqual(expanded, data)
+        tag_bytes = pywolf.compression.rlew_tag_bytes(tag)
+        self.assertEqual(pywolf.compression.rlew_expand(compressed, tag, tag_bytes=tag_bytes), data)
 
     def testRLEB(self):
         logger = logging.getLogger()
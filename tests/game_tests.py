@@ -0,0 +1,278 @@
+import array
+import itertools
+import logging
+import struct
+import sys
+import unittest
+
+import pywolf.game
+
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        logger = logging.getLogger()
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setLevel(logging.DEBUG)
+        logger.addHandler(stdout_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.info('-' * 80)
+        self._stdout_handler = stdout_handler
+
+    def tearDown(self):
+        logger = logging.getLogger()
+        logger.removeHandler(self._stdout_handler)
+
+    def build_tilemap(self, size, planes_count=3):
+        width, height = size
+        planes = [array.array('H', ((i << 12) | (y << 6) | x for y in range(height) for x in range(width)))
+                  for i in range(planes_count)]
+        return pywolf.game.TileMap(size, planes, 'test')
+
+    def testTileMapHeader(self):
+        logger = logging.getLogger()
+        logger.info('testTileMapHeader')
+
+        header = pywolf.game.TileMapHeader((11, 22, 33), (44, 55, 66), (64, 32), 'Wolf1 Map1')
+        data = header.to_bytes()
+        self.assertEqual(len(data), 38)
+        parsed = pywolf.game.TileMapHeader.from_bytes(data)
+        self.assertEqual(parsed.plane_offsets, (11, 22, 33))
+        self.assertEqual(parsed.plane_sizes, (44, 55, 66))
+        self.assertEqual(parsed.size, (64, 32))
+        self.assertEqual(parsed.name, 'Wolf1 Map1')
+        self.assertIs(parsed.to_bytes(), parsed.to_bytes())
+        self.assertEqual(parsed.to_bytes(), data)
+        parsed.name = 'Other'
+        self.assertEqual(pywolf.game.TileMapHeader.from_bytes(parsed.to_bytes()).name, 'Other')
+
+        header = pywolf.game.TileMapHeader([11, 22, 33], [44, 55, 66], [64, 32], 'Wolf1 Map1')
+        self.assertEqual(header.plane_offsets, (11, 22, 33))
+        self.assertEqual(header.to_bytes(), data)
+        header.plane_offsets = [1, 2, 3]
+        data = header.to_bytes()
+        header.plane_offsets[1] = 99  # mutated in place
+        self.assertEqual(pywolf.game.TileMapHeader.from_bytes(header.to_bytes()).plane_offsets, (1, 99, 3))
+        self.assertNotEqual(header.to_bytes(), data)
+
+    def testTileMapIndexing(self):
+        logger = logging.getLogger()
+        logger.info('testTileMapIndexing')
+
+        size = (64, 32)
+        tilemap = self.build_tilemap(size)
+        for y in range(size[1]):
+            for x in range(size[0]):
+                expected = [(i << 12) | (y << 6) | x for i in range(3)]
+                self.assertEqual(tilemap[x, y], expected)
+                self.assertEqual(tilemap[x, y, 1], expected[1])
+                self.assertEqual(tilemap.get((x, y)), expected)
+
+        for key in ((-1, 0), (64, 0), (0, -1), (0, 32), (-1, 1), (64, 30), (-1, 1, 0)):
+            self.assertIsNone(tilemap.get(key))
+        self.assertEqual(tilemap.get((64, 0), 123), 123)
+        self.assertEqual(tilemap.get((3, 2, 2)), (2 << 12) | (2 << 6) | 3)
+
+        self.assertEqual(tilemap.get_tile(63, 31, 2), tilemap[63, 31, 2])
+        tilemap.set_tile(62, 31, 2, 0x1234)
+        self.assertEqual(tilemap[62, 31, 2], 0x1234)
+
+        tilemap[63, 31, 2] = 0xABCD
+        self.assertEqual(tilemap[63, 31, 2], 0xABCD)
+        tilemap[0, 31] = [1, 2, 3]
+        self.assertEqual(tilemap[0, 31], [1, 2, 3])
+
+    def testTileMapCube(self):
+        logger = logging.getLogger()
+        logger.info('testTileMapCube')
+
+        tilemap = self.build_tilemap((64, 32))
+        area = 64 * 32
+        self.assertEqual(tilemap.dimensions, tilemap.size)
+        self.assertEqual(len(tilemap.cube), 3 * area)
+        tilemap.planes[2][5] = 0x1234
+        self.assertEqual(tilemap.cube[2 * area + 5], 0x1234)
+        tilemap[5, 0] = [7, 8, 9]
+        self.assertEqual([plane[5] for plane in tilemap.planes], [7, 8, 9])
+        with self.assertRaises(BufferError):  # planes are live views of the cube
+            tilemap.cube.append(0)
+
+        packed = pywolf.game.TileMap.from_cube(tilemap.size, array.array('H', tilemap.cube), 'packed')
+        self.assertEqual(packed[5, 0], [7, 8, 9])
+        self.assertEqual(len(packed.planes), 3)
+        with self.assertRaises(TypeError):  # one plane per sequence item, never a whole cube
+            pywolf.game.TileMap(tilemap.size, array.array('H', tilemap.cube), 'cube')
+        single = pywolf.game.TileMap(tilemap.size, [array.array('H', tilemap.planes[1])], 'single')
+        self.assertEqual(single[5, 0], [8])
+
+        clone = pywolf.game.TileMap(tilemap.size, tilemap.planes, 'clone')
+        self.assertEqual(clone.cube, tilemap.cube)
+        clone[5, 0, 0] = 0
+        self.assertEqual(tilemap[5, 0, 0], 7)
+
+    def testTileMapManager(self):
+        logger = logging.getLogger()
+        logger.info('testTileMapManager')
+
+        size = (64, 32)
+        area = size[0] * size[1]
+        header = pywolf.game.TileMapHeader((0, 0, 0), (0, 0, 0), size, 'test')
+        raw_planes = [struct.pack('<{:d}H'.format(area), *(((i << 12) | j) for j in range(area)))
+                      for i in range(3)]
+        tilemap_manager = pywolf.game.TileMapManager([(header, raw_planes)])
+        tilemap = tilemap_manager[0]
+        self.assertEqual(tilemap.name, 'test')
+        self.assertEqual(tilemap.cube.tolist(), [((i << 12) | j) for i in range(3) for j in range(area)])
+        self.assertEqual(tilemap[1, 1], [(i << 12) | 65 for i in range(3)])
+
+    def testTileMapFindAll(self):
+        logger = logging.getLogger()
+        logger.info('testTileMapFindAll')
+
+        size = (64, 32)
+        tilemap = pywolf.game.TileMap(size, [array.array('H', bytes(size[0] * size[1] * 2))], 'test')
+        tilemap[0, 0, 0] = 0x0101
+        tilemap[1, 0, 0] = 0x0101
+        tilemap[63, 31, 0] = 0x0101
+        tilemap[3, 4, 0] = 0x0100  # bytes 00 01 01 00: 0x0101 found at an odd offset
+        tilemap[4, 4, 0] = 0x0001
+        self.assertEqual(tilemap.find_all(0x0101, 0), ([0, 1, 63], [0, 0, 31]))
+        self.assertEqual(tilemap.find_all(0x0100, 0), ([3], [4]))
+        self.assertEqual(tilemap.find_all(0xFFFF, 0), ([], []))
+
+        tiles_x, tiles_y = tilemap.find_all(0x0101, 0)
+        self.assertEqual(tilemap.gather(tiles_x, tiles_y, 0), [0x0101] * 3)
+        self.assertEqual(tilemap.gather([3, 4], [4, 4], 0), [0x0100, 0x0001])
+        self.assertEqual(tilemap.gather_safe([3, 4, -1, 64, 0, 63], [4, 4, 0, 0, 32, -1], 0),
+                         [0x0100, 0x0001, 0, 0, 0, 0])
+        self.assertEqual(tilemap.gather_safe([64, 63], [0, 31], 0, default=None), [None, 0x0101])
+
+    def testTileMapQuantized(self):
+        logger = logging.getLogger()
+        logger.info('testTileMapQuantized')
+
+        size = (64, 32)
+        area = size[0] * size[1]
+        header = pywolf.game.TileMapHeader((0, 0), (0, 0), size, 'test')
+        raw_planes = [struct.pack('<{:d}H'.format(area), *((j + i) & 0xFF for j in range(area)))
+                      for i in range(2)]
+        tilemap = pywolf.game.TileMapManager([(header, raw_planes)])[0]
+        self.assertEqual(tilemap.cube.typecode, 'H')
+        self.assertEqual(tilemap[3, 1], [67, 68])
+        self.assertEqual(tilemap.find_all(67, 0), ([3, 3, 3, 3, 3, 3, 3, 3], [1, 5, 9, 13, 17, 21, 25, 29]))
+        self.assertEqual(tilemap.find_all(0x1234, 0), ([], []))
+
+        lut = pywolf.game.tile_lut([67, 0x1234])
+        mask = tilemap.classify(lut, 0)
+        self.assertEqual(len(mask), area)
+        self.assertEqual(list(itertools.compress(range(area), mask)), list(range(67, area, 256)))
+
+        plane = tilemap.planes[1]  # views stay valid across wide writes
+        tilemap[3, 1, 1] = 0x1234
+        self.assertEqual(plane[1 * 64 + 3], 0x1234)
+        tilemap.planes[1][4 + 64] = 300
+        self.assertEqual(tilemap[4, 1], [68, 300])
+        self.assertEqual(tilemap[3, 1], [67, 0x1234])
+        mask = tilemap.classify(lut, 1)
+        self.assertEqual(list(itertools.compress(range(area), mask)), sorted({67} | set(range(66, area, 256))))
+
+    def testTileMapRegion(self):
+        logger = logging.getLogger()
+        logger.info('testTileMapRegion')
+
+        tilemap = self.build_tilemap((64, 32))
+        region = tilemap.region(60, 29, 64, 32, 0)
+        self.assertEqual([list(row) for row in region],
+                         [[(y << 6) | x for x in range(60, 64)] for y in range(29, 32)])
+        tilemap[60, 29, 0] = 0  # regions are copies
+        self.assertEqual(region[0][0], (29 << 6) | 60)
+        tilemap[60, 29, 0] = (29 << 6) | 60
+        self.assertEqual([list(row) for row in tilemap[60:, 29:, 0]],
+                         [list(row) for row in region])
+
+        column = tilemap.column(63, 1, 32, 2)
+        self.assertEqual(list(column), [tilemap[63, y, 2] for y in range(1, 32)])
+        self.assertEqual([list(c) for c in tilemap.column(0, 0, 3)],
+                         [[tilemap[0, y, i] for y in range(3)] for i in range(3)])
+
+        tiles = list(tilemap.iter_tiles_in_region(62, 30, 64, 32))
+        self.assertEqual([coords for coords, _ in tiles], [(62, 30), (63, 30), (62, 31), (63, 31)])
+        self.assertEqual([list(tile) for _, tile in tiles], [tilemap[coords] for coords, _ in tiles])
+        tiles = list(tilemap.iter_tiles_in_region(62, 30, 64, 32, 1))
+        self.assertEqual(tiles, [(coords, tilemap[coords + (1,)]) for coords, _ in tiles])
+
+    def testTileMapCast(self):
+        logger = logging.getLogger()
+        logger.info('testTileMapCast')
+
+        size = (64, 32)
+        tilemap = pywolf.game.TileMap(size, [array.array('B', bytes(size[0] * size[1]))], 'test')
+        for x in range(64):
+            tilemap[x, 0, 0] = 1
+            tilemap[x, 31, 0] = 1
+        for y in range(32):
+            tilemap[0, y, 0] = 1
+            tilemap[63, y, 0] = 1
+        tilemap[20, 10, 0] = 2
+        lut = pywolf.game.tile_lut([1, 2])
+
+        VERTICAL, HORIZONTAL = pywolf.game.VERTICAL, pywolf.game.HORIZONTAL
+        self.assertEqual(tilemap.cast_column(10.5, 10.5, 0, lut), (9.5, 2, VERTICAL))
+        self.assertEqual(tilemap.cast_column(10.5, 10.5, 180, lut), (9.5, 1, VERTICAL))
+        distance, tile, side = tilemap.cast_column(10.5, 10.5, 90, lut)
+        self.assertAlmostEqual(distance, 9.5)
+        self.assertEqual((tile, side), (1, HORIZONTAL))
+        distance, tile, side = tilemap.cast_column(10.5, 10.5, 270, lut)
+        self.assertAlmostEqual(distance, 20.5)
+        self.assertEqual((tile, side), (1, HORIZONTAL))
+        distance, tile, side = tilemap.cast_column(10.5, 10.5, 45, lut)
+        self.assertAlmostEqual(distance, 9.5 * 2 ** 0.5)
+        self.assertIsNone(tilemap.cast_column(10.5, 10.5, 0, lut, max_distance=5))
+        self.assertIsNone(tilemap.cast_column(10.5, 10.5, 0, pywolf.game.tile_lut([])))
+
+        angles = [0, 180, 0]
+        self.assertEqual(tilemap.cast_columns(10.5, 10.5, angles, lut),
+                         [tilemap.cast_column(10.5, 10.5, angle, lut) for angle in angles])
+
+    def testEntityTable(self):
+        logger = logging.getLogger()
+        logger.info('testEntityTable')
+
+        entities = pywolf.game.EntityTable()
+        handle0 = entities.add((1.5, 2.5, 90.0), health=100, team_index=1)
+        handle1 = entities.add((3.0, 4.0, 0.0))
+        self.assertEqual(len(entities), 2)
+        self.assertEqual(list(entities), [handle0, handle1])
+        self.assertEqual(entities.get_pose(handle0), (1.5, 2.5, 90.0))
+        entities.set_pose(handle1, (5.0, 6.0, 180.0))
+        self.assertEqual(entities.get_pose(handle1), (5.0, 6.0, 180.0))
+        self.assertEqual(list(entities.healths), [100, 0])
+        self.assertEqual(list(entities.team_indices), [1, 0])
+
+        handle2 = entities.spawn((7.0, 8.0, 270.0), health=50)
+        self.assertEqual(handle2, 2)
+        entities.despawn(handle0)
+        self.assertEqual(len(entities), 2)
+        self.assertEqual(list(entities), [handle1, handle2])
+        handle3 = entities.spawn((9.0, 10.0, 0.0), health=25, team_index=3)
+        self.assertEqual(handle3, handle0)
+        self.assertEqual(list(entities), [handle0, handle1, handle2])
+        self.assertEqual(entities.get_pose(handle3), (9.0, 10.0, 0.0))
+        self.assertEqual(list(entities.healths), [25, 0, 50])
+        self.assertEqual(list(entities.team_indices), [3, 0, 0])
+
+    def testGamePlayers(self):
+        logger = logging.getLogger()
+        logger.info('testGamePlayers')
+
+        game = pywolf.game.Game(None, None)
+        game.entities.add((0.0, 0.0, 0.0))
+        handle = game.add_player((1.5, 2.5, 90.0), team_index=2)
+        self.assertEqual(list(game.players), [handle])
+        self.assertEqual(game.entities.get_pose(handle), (1.5, 2.5, 90.0))
+        self.assertEqual(game.entities.healths[handle], 100)
+        self.assertEqual(game.entities.team_indices[handle], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
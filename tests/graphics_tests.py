@@ -0,0 +1,223 @@
+import io
+import logging
+import struct
+import sys
+import unittest
+
+from PIL import ImageDraw, ImageFont
+
+import pywolf.graphics
+
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        logger = logging.getLogger()
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setLevel(logging.DEBUG)
+        logger.addHandler(stdout_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.info('-' * 80)
+        self._stdout_handler = stdout_handler
+
+    def tearDown(self):
+        logger = logging.getLogger()
+        logger.removeHandler(self._stdout_handler)
+
+    def build_sprite(self):
+        # 4x4 sprite: column 1 has a post on rows 1..2, column 2 is empty
+        header_size = 4 + 2 * 2
+        commands_size = (6 + 2) + 2
+        pixels_offset = header_size + commands_size
+        y_start, y_endex = 1, 3
+        chunk = struct.pack('<HHHH', 1, 2, header_size, header_size + 8)
+        chunk += struct.pack('<HhH', y_endex * 2, pixels_offset - y_start, y_start * 2) + b'\0\0'
+        chunk += b'\0\0'
+        chunk += bytes([10, 11])
+        return chunk
+
+    def testSpriteExpand(self):
+        logger = logging.getLogger()
+        logger.info('testSpriteExpand')
+
+        chunk = self.build_sprite()
+        expected = bytearray([0xFF] * 16)
+        expected[1 * 4 + 1] = 10
+        expected[1 * 4 + 2] = 11
+        self.assertEqual(pywolf.graphics.sprite_expand(chunk, (4, 4), linear=False), expected)
+
+        linear = bytearray([0xFF] * 16)
+        linear[1 * 4 + 1] = 10
+        linear[2 * 4 + 1] = 11
+        self.assertEqual(pywolf.graphics.sprite_expand(chunk, (4, 4), linear=True), linear)
+
+        out = bytearray(range(16 + 10))  # oversized scratch
+        pixels = pywolf.graphics.sprite_expand(chunk, (4, 4), linear=True, out=out)
+        self.assertEqual(len(pixels), 16)
+        self.assertEqual(pixels, linear)
+        self.assertEqual(out[16:], bytes(range(16, 16 + 10)))
+        out[0] = 0  # aliases the scratch
+        self.assertEqual(pixels[0], 0)
+
+    def testAnsiTilesShared(self):
+        logger = logging.getLogger()
+        logger.info('testAnsiTilesShared')
+
+        font = ImageFont.load_default()
+        font_size = (8, 16)
+        text_size = (4, 2)
+        text = 'AbC d'
+        attrs = bytes([0x1F, 0x2E, 0x9C, 0x07, 0x4A])
+        tiles = {}
+
+        screen = pywolf.graphics.render_ansi_screen(text_size, font, text, attrs, font_size=font_size, tiles=tiles)
+        image = pywolf.graphics.create_ansi_image(text_size, font_size)
+        pywolf.graphics.render_ansi_line(image, (0, 0), font, text, attrs, font_size=font_size, tiles=tiles)
+        self.assertEqual(image.tobytes(), screen.tobytes())
+
+        screen = pywolf.graphics.render_ansi_screen(text_size, font, text, attrs, font_size=font_size, tiles=tiles)
+        self.assertEqual(image.tobytes(), screen.tobytes())
+        self.assertEqual(sum(key[0] in ('image', 'rows') for key in tiles), 2 * len(text))
+        self.assertEqual({key[1] for key in tiles if key[0] == 'overhang'}, set(text))
+
+    def testAnsiGlyphOverhang(self):
+        logger = logging.getLogger()
+        logger.info('testAnsiGlyphOverhang')
+
+        font = ImageFont.load_default()
+        text_size = (4, 2)
+        text = 'iWxW.W@i'
+        attrs = bytes([0x1F, 0x2E, 0x9C, 0x07, 0x4A, 0x3B, 0x61, 0x70])
+
+        for font_size in ((8, 16), (5, 16)):  # glyphs wider than the cell ink their neighbours
+            tiles = {}
+            self.assertTrue(pywolf.graphics.ansi_glyph_overhangs(font, font_size, 'W', tiles))
+            self.assertFalse(pywolf.graphics.ansi_glyph_overhangs(font, font_size, ' ', tiles))
+
+            # Uncached reference: each row fills its backgrounds, then draws its glyphs in order
+            reference = pywolf.graphics.create_ansi_image(text_size, font_size)
+            draw = ImageDraw.Draw(reference)
+            font_width, font_height = font_size
+            for y in range(text_size[1]):
+                cells = range(y * text_size[0], (y + 1) * text_size[0])
+                for x, index in enumerate(cells):
+                    box = (x * font_width, y * font_height, (x + 1) * font_width - 1, (y + 1) * font_height - 1)
+                    draw.rectangle(box, fill=(attrs[index] >> 4) & 0x07)
+                for x, index in enumerate(cells):
+                    draw.text((x * font_width, y * font_height), text[index], font=font, fill=attrs[index] & 0x0F)
+
+            screen = pywolf.graphics.render_ansi_screen(text_size, font, text, attrs, font_size=font_size, tiles=tiles)
+            self.assertEqual(screen.tobytes(), reference.tobytes())
+            image = pywolf.graphics.create_ansi_image(text_size, font_size)
+            pywolf.graphics.render_ansi_line(image, (0, 0), font, text, attrs, font_size=font_size, tiles=tiles)
+            self.assertEqual(image.tobytes(), reference.tobytes())
+
+    def testDOSScreenBlink(self):
+        logger = logging.getLogger()
+        logger.info('testDOSScreenBlink')
+
+        font = ImageFont.load_default()
+        font_size = (8, 16)
+        text_size = (4, 2)
+        chars = b'AbCdEfGh'
+        attrs = bytes([0x1F, 0x9E, 0x9C, 0x07, 0x4A, 0x8A, 0x07, 0xF1])
+        data = bytes(9) + bytes(b for pair in zip(chars, attrs) for b in pair) + b'\0'
+        screen = pywolf.graphics.DOSScreen(data, font, text_size, font_size)
+        self.assertEqual(len(screen.frames), 2)
+
+        text = pywolf.graphics.cp437_to_unicode(chars)
+        frame0 = pywolf.graphics.render_ansi_screen(text_size, font, text, attrs, font_size=font_size)
+        frame1 = pywolf.graphics.render_ansi_screen(text_size, font, text, attrs, font_size=font_size, special='hide')
+        self.assertEqual(screen.frames[0].tobytes(), frame0.tobytes())
+        self.assertEqual(screen.frames[1].tobytes(), frame1.tobytes())
+        self.assertNotEqual(frame0.tobytes(), frame1.tobytes())
+
+    def testRGBPaletteNearest(self):
+        logger = logging.getLogger()
+        logger.info('testRGBPaletteNearest')
+
+        palette_colors = [(0, 0, 0), (10, 20, 30), (100, 100, 100), (110, 100, 100), (255, 255, 255)]
+        for index, color in enumerate(palette_colors):
+            self.assertEqual(pywolf.graphics.rgbpalette_nearest(palette_colors, color), index)
+        self.assertEqual(pywolf.graphics.rgbpalette_nearest(palette_colors, (250, 250, 240)), 4)
+        self.assertEqual(pywolf.graphics.rgbpalette_nearest(palette_colors, (105, 100, 100)), 2)  # tie: first wins
+
+        pixels_rgb = bytes([10, 20, 30, 255, 255, 255, 11, 21, 29, 10, 20, 30])
+        self.assertEqual(pywolf.graphics.rgbpixels_to_indices(pixels_rgb, palette_colors), bytes([1, 4, 1, 1]))
+
+        cache = {bytes([255, 255, 255]): 0}  # consulted before the palette
+        indices = pywolf.graphics.rgbpixels_to_indices(pixels_rgb, palette_colors, cache)
+        self.assertEqual(indices, bytes([1, 0, 1, 1]))
+        self.assertEqual(cache, {bytes([10, 20, 30]): 1, bytes([255, 255, 255]): 0, bytes([11, 21, 29]): 1})
+        indices = pywolf.graphics.rgbpixels_to_indices(pixels_rgb, [(0, 0, 0)], cache)
+        self.assertEqual(indices, bytes([1, 0, 1, 1]))
+
+    def testPixelsReorder(self):
+        logger = logging.getLogger()
+        logger.info('testPixelsReorder')
+
+        width, height = 8, 3
+        pixels = bytes(range(width * height))
+        transposed = bytes(pixels[x * height + y] for y in range(height) for x in range(width))
+        area_4 = (width >> 2) * height
+        linear = bytes(pixels[(y * (width >> 2) + (x >> 2)) + ((x & 3) * area_4)]
+                       for y in range(height) for x in range(width))
+
+        for padding in (b'', b'\xAA' * 5):
+            self.assertEqual(pywolf.graphics.pixels_transpose(pixels + padding, (width, height)), transposed)
+            self.assertEqual(pywolf.graphics.pixels_linearize(pixels + padding, (width, height)), linear)
+
+    def testBitmapExpand(self):
+        logger = logging.getLogger()
+        logger.info('testBitmapExpand')
+
+        self.assertEqual(pywolf.graphics.bitmap_expand(b''), b'')
+        for datum in (0x00, 0x01, 0x80, 0xA5, 0xFF):
+            self.assertEqual(pywolf.graphics.bitmap_expand(bytes([datum])),
+                             pywolf.graphics.BYTE_MASK_EXPANDED[datum])
+
+        bitmap = bytes([0xF0, 0x81, 0x3C, 0x00, 0xFF, 0x5A])  # 2 rows of 3 bytes, MSB leftmost
+        expected = b''.join(bytes((datum >> (7 - bit)) & 1 for bit in range(8)) for datum in bitmap)
+        self.assertEqual(pywolf.graphics.bitmap_expand(bitmap), expected)
+        self.assertEqual(pywolf.graphics.bitmap_expand(bytearray(bitmap)), expected)
+
+    def build_winfnt(self, height, first, widths, columns_data):
+        header_size = pywolf.graphics.WINFNT_HEADER_STRUCT.size
+        offset = header_size + len(widths) * 4
+        table = b''
+        for width, data in zip(widths, columns_data):
+            table += struct.pack('<HH', width, offset)
+            offset += len(data)
+        values = {name: 0 for name, _ in pywolf.graphics.WINFNT_HEADER_FMT}
+        values.update(dfVersion=0x200, dfCopyright=b'Test font\0junk', dfPixHeight=height,
+                      dfFirstChar=first, dfLastChar=first + len(widths) - 2, dfMaxWidth=max(widths))
+        names = [name for name, _ in pywolf.graphics.WINFNT_HEADER_FMT]
+        header = pywolf.graphics.WINFNT_HEADER_STRUCT.pack(*(values[name] for name in names))
+        return header + table + b''.join(columns_data)
+
+    def testWinFntRead(self):
+        logger = logging.getLogger()
+        logger.info('testWinFntRead')
+
+        height = 3
+        widths = [5, 12, 16]  # one narrow glyph, one not a multiple of 8, one exactly 2 bytes wide
+        columns_data = [  # column-major: each byte column holds height rows
+            bytes([0xF8, 0x88, 0xF8]),
+            bytes([0xFF, 0x80, 0xAA, 0xF0, 0x10, 0x50]),
+            bytes([0x01, 0x02, 0x03, 0x80, 0x40, 0xC0]),
+        ]
+        data = self.build_winfnt(height, 65, widths, columns_data)
+        stream = io.BytesIO(b'\xAA' * 7 + data)  # the font may start anywhere in the stream
+        stream.seek(7)
+        fields, images = pywolf.graphics.winfnt_read(stream)
+
+        self.assertEqual(fields['dfCopyright'], b'Test font')
+        self.assertEqual(fields['dfPixHeight'], height)
+        self.assertEqual([width for width, _ in fields['dfCharTable']], widths)
+        self.assertEqual(len(images), len(widths))
+
+        for width, columns, image in zip(widths, columns_data, images):
+            self.assertEqual(image.size, (width, height))
+            expected = bytes((columns[(x >> 3) * height + y] >> (7 - (x & 7))) & 1
+                             for y in range(height) for x in range(width))
+            self.assertEqual(image.tobytes(), expected)
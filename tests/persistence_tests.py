@@ -0,0 +1,131 @@
+import io
+import logging
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import unittest
+
+import pywolf.compression
+import pywolf.game
+import pywolf.persistence
+
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        logger = logging.getLogger()
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setLevel(logging.DEBUG)
+        logger.addHandler(stdout_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.info('-' * 80)
+        self._stdout_handler = stdout_handler
+
+    def tearDown(self):
+        logger = logging.getLogger()
+        logger.removeHandler(self._stdout_handler)
+
+    def testCompressedChunksCache(self):
+        logger = logging.getLogger()
+        logger.info('testCompressedChunksCache')
+
+        rng = random.Random(0)
+        small = bytes(range(100)) * 10  # below the threshold, stored as is
+        compressible = bytes(4096)
+        incompressible = bytes(rng.randrange(256) for _ in range(4096))
+        chunks = [b'', small, compressible, incompressible]
+
+        cache = pywolf.persistence.CompressedChunksCache(threshold=1024)
+        cache.extend(chunks)
+        self.assertEqual(len(cache), len(chunks))
+        self.assertEqual(list(cache), chunks)
+        self.assertEqual([cache[i] for i in range(-len(chunks), 0)], chunks)
+        self.assertEqual(cache[1:3], chunks[1:3])
+        self.assertIs(cache[1], small)
+        self.assertIs(cache[3], incompressible)
+        self.assertLess(cache.stored_size(), len(small) + len(incompressible) + 100)
+
+        handler = pywolf.persistence.PrecachedChunksHandler(chunks, cache)
+        self.assertEqual(len(handler), len(chunks))
+        self.assertEqual(handler[2], compressible)
+        self.assertEqual(list(handler), chunks)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stored_size(), 0)
+
+    def build_maps(self, tag, maps_planes, size):
+        data = bytearray(b'TED5v1.0')
+        offsets = []
+        for name, planes in maps_planes:
+            if planes is None:
+                offsets.append(0)
+                continue
+            plane_offsets = []
+            plane_sizes = []
+            for plane in planes:
+                compressed = pywolf.compression.rlew_compress(plane, tag)
+                compressed = struct.pack('<H', len(plane)) + compressed
+                chunk = struct.pack('<H', len(compressed)) + pywolf.compression.carmack_compress(compressed)
+                plane_offsets.append(len(data))
+                plane_sizes.append(len(chunk))
+                data += chunk
+            offsets.append(len(data))
+            data += pywolf.game.TileMapHeader(plane_offsets, plane_sizes, size, name).to_bytes()
+        header = struct.pack('<H{:d}L'.format(len(offsets)), tag, *offsets)
+        return bytes(data), header
+
+    def testMapChunksHandler(self):
+        logger = logging.getLogger()
+        logger.info('testMapChunksHandler')
+
+        rng = random.Random(0)
+        tag = 0xABCD
+        size = (8, 8)
+        area = size[0] * size[1]
+        maps_planes = [
+            ('Map A', [bytes(area * 2), bytes([1, 0]) * area, bytes(rng.randrange(4) for _ in range(area * 2))]),
+            ('Missing', None),
+            ('Map B', [bytes([2, 0, 3, 0]) * (area // 2), bytes(area * 2), bytes([5, 0]) * area]),
+        ]
+        data, header = self.build_maps(tag, maps_planes, size)
+
+        handler = pywolf.persistence.MapChunksHandler()
+        handler.load(io.BytesIO(data), io.BytesIO(header))
+        self.assertEqual(len(handler), len(maps_planes))
+        expected = []
+        for index, (name, planes) in enumerate(maps_planes):
+            map_header, map_planes = handler.extract_chunk(index)
+            if planes is None:
+                self.assertIsNone(map_header)
+                self.assertEqual(map_planes, [None] * handler.planes_count)
+            else:
+                self.assertEqual(map_header.name, name)
+                self.assertEqual(map_header.size, size)
+                self.assertEqual(map_planes, planes)
+            self.assertIs(handler.extract_header(index), map_header)
+            expected.append((map_header, map_planes))
+        handler.clear()
+
+        fd, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, 'wb') as data_file:
+                data_file.write(data)
+            with open(path, 'rb') as data_file:
+                data_map = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+                handler.load(data_map, io.BytesIO(header))
+                for index, (map_header, map_planes) in enumerate(expected):
+                    mapped_header = handler.extract_header(index)
+                    if map_header is None:
+                        self.assertIsNone(mapped_header)
+                    else:
+                        self.assertEqual(mapped_header.to_bytes(), map_header.to_bytes())
+                    self.assertEqual(handler.extract_chunk(index)[1], map_planes)
+                handler.clear()  # releases the view on the mapping
+                data_map.close()
+                self.assertTrue(data_map.closed)
+        finally:
+            os.remove(path)
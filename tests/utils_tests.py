@@ -0,0 +1,43 @@
+import io
+import logging
+import struct
+import sys
+import unittest
+
+import pywolf.utils
+
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        logger = logging.getLogger()
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setLevel(logging.DEBUG)
+        logger.addHandler(stdout_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.info('-' * 80)
+        self._stdout_handler = stdout_handler
+
+    def tearDown(self):
+        logger = logging.getLogger()
+        logger.removeHandler(self._stdout_handler)
+
+    def testStreamUnpackBulk(self):
+        logger = logging.getLogger()
+        logger.info('testStreamUnpackBulk')
+
+        stream = io.BytesIO(struct.pack('<5H', 1, 2, 3, 4, 5))
+        self.assertEqual(pywolf.utils.stream_unpack_bulk('<H', stream, 4), (1, 2, 3, 4))
+        self.assertEqual(stream.tell(), 8)
+
+        stream = io.BytesIO(struct.pack('<HHHH', 1, 2, 3, 4))
+        self.assertEqual(pywolf.utils.stream_unpack_bulk('<HH', stream, 2), (1, 2, 3, 4))
+
+        stream = io.BytesIO(struct.pack('<2HB2HB', 1, 2, 3, 4, 5, 6))
+        self.assertEqual(pywolf.utils.stream_unpack_bulk('<2HB', stream, 2), (1, 2, 3, 4, 5, 6))
+
+        stream = io.BytesIO(struct.pack('<3L', 7, 8, 9))
+        self.assertEqual(list(pywolf.utils.stream_unpack_array('<L', stream, 3)), [7, 8, 9])
+
+        stream = io.BytesIO(b'')
+        self.assertEqual(pywolf.utils.stream_unpack_bulk('<H', stream, 0), ())